@@ -1,11 +1,19 @@
 @echo off
 setlocal
 
-rem Usage: start_onlyoffice.bat [port] [extra_args]
+rem Usage: start_onlyoffice.bat [port] [headless] [extra_args]
 set "PORT=%~1"
 if "%PORT%"=="" set "PORT=9222"
 
-set "EXTRA=%~2"
+set "EXTRA=%~3"
+
+rem Launch-time Chromium flags: attach-mode clients (debuggerAddress) cannot
+rem apply these later, so this script is the place where they take effect.
+rem DRIVER_HEADLESS=1 lets CI flip headless without changing the command line.
+set "WANT_HEADLESS="
+if /I "%~2"=="headless" set "WANT_HEADLESS=1"
+if "%DRIVER_HEADLESS%"=="1" set "WANT_HEADLESS=1"
+if defined WANT_HEADLESS set "EXTRA=--headless=new --disable-gpu --no-sandbox %EXTRA%"
 
 set "OO_PATH=%ONLYOFFICE_PATH%"
 if "%OO_PATH%"=="" set "OO_PATH=C:\Program Files\ONLYOFFICE\DesktopEditors\DesktopEditors.exe"
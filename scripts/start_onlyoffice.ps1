@@ -1,9 +1,21 @@
 param(
     [string]$OnlyOfficePath = $env:ONLYOFFICE_PATH,
     [int]$Port = 9222,
+    [switch]$Headless,
+    [switch]$NoImages,
     [string]$ExtraArgs = ""
 )
 
+# Launch-time Chromium flags: attach-mode clients (debuggerAddress) cannot
+# apply these later, so this script is the place where they take effect.
+# DRIVER_HEADLESS=1 lets CI flip headless without changing the command line.
+if ($Headless -or $env:DRIVER_HEADLESS -eq "1") {
+    $ExtraArgs = "--headless=new --disable-gpu --no-sandbox $ExtraArgs"
+}
+if ($NoImages) {
+    $ExtraArgs = "--blink-settings=imagesEnabled=false $ExtraArgs"
+}
+
 if (-not $OnlyOfficePath) {
     # Typical install path; adjust if differs
     $OnlyOfficePath = "C:\Program Files\ONLYOFFICE\DesktopEditors\DesktopEditors.exe"
@@ -11,22 +11,53 @@ from selenium.webdriver.support.relative_locator import RelativeBy
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement
 
+from .utils.logging_utils import get_logger
+
 
 class DriverOnlyOffice:
     def __init__(
         self,
         driver_path: Path | None = None,
         debugger_address: str = "127.0.0.1:9222",
+        *,
+        headless: bool = False,
+        block_images: bool = False,
     ):
-        self._build_driver(driver_path, debugger_address)
+        # Цепочка iframe, в которой нашёлся предыдущий элемент: повторные
+        # поиски сперва пробуют её вместо полного обхода всех фреймов.
+        self._last_frame_chain: list[WebElement] = []
+        # DRIVER_HEADLESS=1 читают scripts/start_onlyoffice.* при запуске
+        # браузера — здесь, в attach-режиме, переменная повлиять уже не может.
+        self._build_driver(
+            driver_path,
+            debugger_address,
+            headless=headless,
+            block_images=block_images,
+        )
 
     def _build_driver(
         self,
         driver_path: Path | None = None,
         debugger_address: str = "127.0.0.1:9222",
+        *,
+        headless: bool = False,
+        block_images: bool = False,
     ) -> webdriver.Chrome:
         chrome_options = Options()
         chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+        if headless or block_images:
+            # debuggerAddress подключается к уже запущенному браузеру, поэтому
+            # опции запуска (--headless=new, prefs с отключением картинок)
+            # Chrome в attach-режиме игнорирует. Применить их можно только при
+            # старте браузера: scripts/start_onlyoffice.ps1 -Headless /
+            # start_onlyoffice.bat <port> headless (или DRIVER_HEADLESS=1,
+            # который читают эти скрипты).
+            get_logger("driver").warning(
+                "headless/block_images не действуют в attach-режиме "
+                "(debuggerAddress=%s): запустите браузер через "
+                "scripts/start_onlyoffice.* с флагом headless",
+                debugger_address,
+            )
 
         if driver_path is None:
             env_path = os.getenv("CHROMEDRIVER_PATH")
@@ -56,23 +87,44 @@ class DriverOnlyOffice:
         """
         self.driver.switch_to.default_content()
 
-        def rec():
+        # Быстрый путь: повторяем цепочку фреймов предыдущего успешного
+        # поиска — большинство последовательных обращений идёт в один фрейм.
+        if self._last_frame_chain:
             try:
+                for frame in self._last_frame_chain:
+                    self.driver.switch_to.frame(frame)
                 return self.driver.find_element(by, selector)
+            except Exception:
+                self._last_frame_chain = []
+                self.driver.switch_to.default_content()
+
+        chain: list[WebElement] = []
+
+        def rec():
+            try:
+                found = self.driver.find_element(by, selector)
+                self._last_frame_chain = list(chain)
+                return found
             except NoSuchElementException:
                 pass
             iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
             for iframe in iframes:
                 try:
                     self.driver.switch_to.frame(iframe)
+                except Exception:
+                    continue
+                chain.append(iframe)
+                try:
                     found = rec()
                     if found:
                         return found
-                    self.driver.switch_to.parent_frame()
                 except StaleElementReferenceException:
+                    pass
+                chain.pop()
+                try:
                     self.driver.switch_to.parent_frame()
                 except Exception:
-                    self.driver.switch_to.parent_frame()
+                    pass
 
             return None
         return rec()
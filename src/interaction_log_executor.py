@@ -10,10 +10,15 @@ This version intentionally keeps logic flat and explicit:
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import json
+import os
+import re
+import sys
+from functools import lru_cache
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
 
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
@@ -28,12 +33,218 @@ from .pages.sql_manager_page import SqlManagerPage
 from .pages.sql_mode_page import SqlModePage
 from .utils.logging_utils import get_logger
 
+try:
+    import orjson
 
-KEYBOARD_EVENTS = {"keydown", "keyup", "keypress"}
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    _loads = json.loads
 
 
-@dataclass(slots=True)
-class InteractionStep:
+KEYBOARD_EVENTS = frozenset({"keydown", "keyup", "keypress"})
+
+
+def _intern_opt(value: Any) -> Any:
+    """Interns the small closed sets of strings the log repeats per line."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# testId prefixes recognized by the input/change handlers, compiled into one
+# regex so classification is a single match instead of repeated startswith
+# calls with per-call prefix concatenation.
+_KNOWN_TESTID_PREFIXES = {
+    "dialog-menu-name-sqlreq": "query_name",
+    "sql-manager-add-query-name": "query_name",
+    "export-destination-select": "export_dest",
+    "sql-manager-export-destination": "export_dest",
+}
+_TESTID_CLASS_RE = re.compile(
+    "^("
+    + "|".join(
+        map(re.escape, sorted(_KNOWN_TESTID_PREFIXES, key=len, reverse=True))
+    )
+    + ")(?:-|$)"
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify_testid(test_id: str) -> str | None:
+    match = _TESTID_CLASS_RE.match(test_id)
+    return _KNOWN_TESTID_PREFIXES[match.group(1)] if match else None
+
+# Helpers preloaded into every new document over CDP so the hot snippets are
+# parsed by the browser once instead of per execute_script call.
+_JS_REPLAY_BOOTSTRAP = """
+window.__replay = {
+  setValue(el, v) {
+    el.value = v;
+    el.dispatchEvent(new Event('input', {bubbles:true}));
+    el.dispatchEvent(new Event('change', {bubbles:true}));
+  },
+  setCM(host, value) {
+    const candidates = [
+      host,
+      host.querySelector ? host.querySelector('.CodeMirror') : null,
+      host.closest ? host.closest('.CodeMirror') : null,
+    ];
+    for (const node of candidates) {
+      if (node && node.CodeMirror) {
+        node.CodeMirror.setValue(value);
+        return true;
+      }
+    }
+    const ta = host.querySelector ? host.querySelector('textarea') : null;
+    if (ta) {
+      ta.value = value;
+      ta.dispatchEvent(new Event('input', {bubbles:true}));
+      ta.dispatchEvent(new Event('change', {bubbles:true}));
+      return true;
+    }
+    return false;
+  },
+  closestCard(el) {
+    return el.closest('.query-card');
+  },
+  queryClosestCard(sel) {
+    const el = document.querySelector(sel);
+    return el ? el.closest('.query-card') : null;
+  },
+};
+"""
+
+# Hot execute_script snippets built once at import instead of per call. Each
+# prefers the preloaded window.__replay helper and falls back inline for
+# documents created before the CDP registration (or when CDP is unavailable).
+_JS_DISPATCH_INPUT_CHANGE = (
+    "if (window.__replay) return window.__replay.setValue(arguments[0], arguments[1]);"
+    "arguments[0].value = arguments[1];"
+    "arguments[0].dispatchEvent(new Event('input', {bubbles:true}));"
+    "arguments[0].dispatchEvent(new Event('change', {bubbles:true}));"
+)
+_JS_DISPATCH_CHANGE = (
+    "arguments[0].dispatchEvent(new Event('change', {bubbles:true}));"
+)
+_JS_SET_VALUE = "arguments[0].value = arguments[1];"
+
+# Zero-width space plus the expand-arrow glyphs dropped from connection titles.
+_TITLE_STRIP_TABLE = str.maketrans("", "", "\u200b\u25b6\u25b8\u25ba")
+_JS_CLOSEST_QUERY_CARD = (
+    "if (window.__replay) return window.__replay.closestCard(arguments[0]);"
+    "return arguments[0].closest('.query-card');"
+)
+_JS_QUERY_CLOSEST_CARD = (
+    "if (window.__replay) return window.__replay.queryClosestCard(arguments[0]);"
+    "const el = document.querySelector(arguments[0]);"
+    "return el ? el.closest('.query-card') : null;"
+)
+_JS_APPLY_OPS = """
+const ops = arguments[0];
+const setCM = (host, value) => {
+  if (window.__replay) return window.__replay.setCM(host, value);
+  const candidates = [
+    host,
+    host.querySelector ? host.querySelector('.CodeMirror') : null,
+    host.closest ? host.closest('.CodeMirror') : null,
+  ];
+  for (const node of candidates) {
+    if (node && node.CodeMirror) {
+      node.CodeMirror.setValue(value);
+      return true;
+    }
+  }
+  const ta = host.querySelector ? host.querySelector('textarea') : null;
+  if (ta) {
+    ta.value = value;
+    ta.dispatchEvent(new Event('input', {bubbles:true}));
+    ta.dispatchEvent(new Event('change', {bubbles:true}));
+    return true;
+  }
+  return false;
+};
+const setValue = (el, value) => {
+  el.value = value;
+  el.dispatchEvent(new Event('input', {bubbles:true}));
+  el.dispatchEvent(new Event('change', {bubbles:true}));
+  return true;
+};
+for (let i = 0; i < ops.length; i++) {
+  const op = ops[i];
+  const el = document.querySelector(op.selector);
+  if (!el) return i;
+  const ok = op.kind === 'setCM' ? setCM(el, op.value) : setValue(el, op.value);
+  if (!ok) return i;
+}
+return -1;
+"""
+
+_JS_CODEMIRROR_SET = """
+if (window.__replay) return window.__replay.setCM(arguments[0], arguments[1]);
+const host = arguments[0];
+const value = arguments[1];
+const candidates = [
+  host,
+  host.querySelector ? host.querySelector('.CodeMirror') : null,
+  host.closest ? host.closest('.CodeMirror') : null,
+];
+
+for (const node of candidates) {
+  if (!node) continue;
+  if (node.CodeMirror) {
+    node.CodeMirror.setValue(value);
+    return true;
+  }
+}
+
+const ta = host.querySelector ? host.querySelector('textarea') : null;
+if (ta) {
+  ta.value = value;
+  ta.dispatchEvent(new Event('input', {bubbles:true}));
+  ta.dispatchEvent(new Event('change', {bubbles:true}));
+  return true;
+}
+
+return false;
+"""
+
+# Exact testId -> (page attribute, method name, ((kwarg, executor attr), ...)).
+# Frozen at module import so per-instance route dicts and closure lambdas are
+# not rebuilt for every executor.
+_EXACT_CLICK_ROUTES: dict[str, tuple[str, str, tuple[tuple[str, str], ...]]] = {
+    "main-sql-mode": ("plugin_page", "click_main_sql_mode", ()),
+    "main-olap-mode": ("plugin_page", "click_main_olap_mode", ()),
+    "main-file-mode": ("plugin_page", "click_main_file_mode", ()),
+    "main-smartdocs": ("plugin_page", "click_main_smartdocs", ()),
+    "main-connection-manager": ("plugin_page", "click_main_connection_manager", ()),
+    "main-settings": ("plugin_page", "click_main_settings", ()),
+    "main-about": ("plugin_page", "click_main_about", ()),
+    "sql-home-open-sql-manager": ("sql_mode_page", "click_sql_manager", ()),
+    "sql-home-open-report-manager": ("sql_mode_page", "click_report_manager", ()),
+    "sql-home-open-query-history": ("sql_mode_page", "click_query_history", ()),
+    "sql-home-open-log": ("sql_mode_page", "click_log", ()),
+    "sql-manager-add-query-open": ("sql_manager_page", "click_add_query_button", ()),
+    "sql-manager-add-query-confirm": ("sql_manager_page", "confirm_add_query", ()),
+    "sql-manager-export-confirm": (
+        "sql_manager_page",
+        "confirm_export",
+        (("timeout", "export_timeout"),),
+    ),
+    "messagebox-button-OK-0": (
+        "sql_manager_page",
+        "click_success_ok",
+        (("timeout", "success_timeout"),),
+    ),
+    "sql-manager-minimize": ("sql_manager_page", "minimize", ()),
+    "sql-manager-toggle-left-panel": ("sql_manager_page", "toggle_left_panel_panel", ()),
+}
+
+
+class InteractionStep(NamedTuple):
+    """
+    One parsed log line. A NamedTuple rather than a dataclass: steps are
+    immutable after from_raw and C-level tuple attribute access is cheaper in
+    the replay loop.
+    """
+
     index: int
     seq: int | None
     page: str | None
@@ -51,37 +262,60 @@ class InteractionStep:
     text: str | None
     value: str | None
     query_key: str | None
+    query_name: str | None
     connection_name: str | None
-    raw: dict[str, Any]
-
-    @property
-    def action_key(self) -> tuple[str, str]:
-        return self.event, self.action
+    action_key: tuple[str, str]
 
     @classmethod
     def from_raw(cls, raw: dict[str, Any], index: int) -> "InteractionStep":
+        event = sys.intern((raw.get("event") or "").strip().lower())
+        action = sys.intern((raw.get("action") or "").strip().lower())
         return cls(
             index=index,
             seq=raw.get("seq"),
-            page=raw.get("page"),
+            page=_intern_opt(raw.get("page")),
             url=raw.get("url"),
             path=raw.get("path"),
-            event=(raw.get("event") or "").strip().lower(),
-            action=(raw.get("action") or "").strip().lower(),
+            event=event,
+            action=action,
             key=raw.get("key"),
             test_id=raw.get("testId"),
             selector=raw.get("selector"),
-            tag=raw.get("tag"),
+            tag=_intern_opt(raw.get("tag")),
             element_id=raw.get("id"),
             name=raw.get("name"),
-            role=raw.get("role"),
+            role=_intern_opt(raw.get("role")),
             text=raw.get("text"),
             value=raw.get("value"),
             query_key=raw.get("queryKey"),
+            query_name=raw.get("queryName"),
             connection_name=raw.get("connectionName"),
-            raw=raw,
+            action_key=(event, action),
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Reconstructs the original JSON field names for rule-style consumers."""
+        return {
+            "seq": self.seq,
+            "page": self.page,
+            "url": self.url,
+            "path": self.path,
+            "event": self.event,
+            "action": self.action,
+            "key": self.key,
+            "testId": self.test_id,
+            "selector": self.selector,
+            "tag": self.tag,
+            "id": self.element_id,
+            "name": self.name,
+            "role": self.role,
+            "text": self.text,
+            "value": self.value,
+            "queryKey": self.query_key,
+            "queryName": self.query_name,
+            "connectionName": self.connection_name,
+        }
+
 
 @dataclass(slots=True)
 class ReplayFailure:
@@ -89,25 +323,56 @@ class ReplayFailure:
     error: Exception
 
 
-def read_interaction_log(log_path: str | Path) -> list[InteractionStep]:
+def iter_interaction_log(
+    log_path: str | Path,
+    *,
+    skip_keyboard: bool = False,
+) -> Iterator[InteractionStep]:
+    """
+    Streams InteractionStep per JSONL line without materializing the whole log.
+    Replay can start on the first line instead of after a full parse.
+
+    skip_keyboard drops keydown/keyup/keypress lines before the dataclass is
+    even built; replay ignores them anyway and they can dominate noisy logs.
+    """
     path = Path(log_path)
     if not path.exists():
         raise FileNotFoundError(f"Interaction log not found: {path}")
 
-    steps: list[InteractionStep] = []
-    with path.open("r", encoding="utf-8-sig") as stream:
+    with path.open("rb") as stream:
+        # Binary mode skips the per-line utf-8 decode; both json and orjson
+        # accept bytes. Only the optional BOM needs handling up front.
+        if stream.read(3) != b"\xef\xbb\xbf":
+            stream.seek(0)
         for line_number, line in enumerate(stream, start=1):
             payload = line.strip()
             if not payload:
                 continue
             try:
-                raw = json.loads(payload)
-            except json.JSONDecodeError as exc:
+                raw = _loads(payload)
+            except ValueError as exc:
+                # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
                 raise ValueError(f"Invalid JSON at {path}:{line_number}") from exc
             if not isinstance(raw, dict):
                 raise ValueError(f"JSON line must be an object at {path}:{line_number}")
-            steps.append(InteractionStep.from_raw(raw, index=line_number))
-    return steps
+            if skip_keyboard and raw.get("event") in KEYBOARD_EVENTS:
+                continue
+            yield InteractionStep.from_raw(raw, index=line_number)
+
+
+def read_interaction_log(log_path: str | Path) -> list[InteractionStep]:
+    """Eager loader for callers that need len()/random access (CLI summary)."""
+    return list(iter_interaction_log(log_path))
+
+
+def count_interaction_log_lines(log_path: str | Path) -> int:
+    """Counts non-empty lines without JSON parsing - O(bytes), no allocations."""
+    count = 0
+    with open(log_path, "rb") as stream:
+        for line in stream:
+            if line.strip():
+                count += 1
+    return count
 
 
 def split_sessions_by_seq(steps: Iterable[InteractionStep]) -> list[list[InteractionStep]]:
@@ -133,13 +398,21 @@ def split_sessions_by_seq(steps: Iterable[InteractionStep]) -> list[list[Interac
 
 
 def find_latest_interaction_log(root: str | Path = ".") -> Path | None:
-    base = Path(root)
-    candidates = sorted(
-        base.glob("interaction-log-*.jsonl"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    return candidates[0] if candidates else None
+    # Single os.scandir pass: DirEntry.stat() is cached and there is no need
+    # to sort all candidates just to pick the newest one.
+    best: Path | None = None
+    best_mtime = -1.0
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if not fnmatch.fnmatchcase(entry.name, "interaction-log-*.jsonl"):
+                continue
+            mtime = entry.stat().st_mtime
+            if mtime > best_mtime:
+                best_mtime = mtime
+                best = Path(entry.path)
+    return best
 
 
 class InteractionLogExecutor:
@@ -168,39 +441,51 @@ class InteractionLogExecutor:
 
         self._active_card: WebElement | None = None
 
-        self._handlers: dict[tuple[str, str], Callable[[InteractionStep], None]] = {
-            ("click", "activate"): self._handle_click_activate,
-            ("click", "preview"): self._handle_click_preview,
-            ("click", "export"): self._handle_click_export,
-            ("click", "delete"): self._handle_click_delete,
-            ("input", "set-value"): self._handle_input_set_value,
-            ("change", "set-value"): self._handle_change_set_value,
-            ("codemirror-change", "set-value"): self._handle_codemirror_set_value,
+        # Generic set-value/codemirror steps are buffered and applied in one
+        # execute_script; any other Selenium action flushes the buffer first
+        # so ordering is preserved.
+        self._pending_ops: list[dict[str, Any]] = []
+
+        # Bound-method fast path for the timeout-carrying routes: no kwargs
+        # dict needs building at dispatch time.
+        self._exact_click_overrides: dict[str, Callable[[], Any]] = {
+            "sql-manager-export-confirm": self._confirm_export_bound,
+            "messagebox-button-OK-0": self._click_success_ok_bound,
         }
 
-        self._exact_click_routes: dict[str, Callable[[], None]] = {
-            "main-sql-mode": self.plugin_page.click_main_sql_mode,
-            "main-olap-mode": self.plugin_page.click_main_olap_mode,
-            "main-file-mode": self.plugin_page.click_main_file_mode,
-            "main-smartdocs": self.plugin_page.click_main_smartdocs,
-            "main-connection-manager": self.plugin_page.click_main_connection_manager,
-            "main-settings": self.plugin_page.click_main_settings,
-            "main-about": self.plugin_page.click_main_about,
-            "sql-home-open-sql-manager": self.sql_mode_page.click_sql_manager,
-            "sql-home-open-report-manager": self.sql_mode_page.click_report_manager,
-            "sql-home-open-query-history": self.sql_mode_page.click_query_history,
-            "sql-home-open-log": self.sql_mode_page.click_log,
-            "sql-manager-add-query-open": self.sql_manager_page.click_add_query_button,
-            "sql-manager-add-query-confirm": self.sql_manager_page.confirm_add_query,
-            "sql-manager-export-confirm": lambda: self.sql_manager_page.confirm_export(
-                timeout=self.export_timeout
-            ),
-            "messagebox-button-OK-0": lambda: self.sql_manager_page.click_success_ok(
-                timeout=self.success_timeout
+        self._install_replay_bootstrap()
+
+        # Memoized lookups: repeated steps against the same testId reuse the
+        # resolved WebElement (validated for staleness) and the built selector,
+        # avoiding a frame-walking round-trip per step.
+        self._element_cache: dict[str, WebElement] = {}
+        self._locator_cache: dict[str, tuple[str, str]] = {}
+        self._last_page: str | None = None
+
+        # Single prefix->handler table evaluated once instead of a chain of
+        # _is_* predicates on every click step.
+        self._prefix_routes: tuple[tuple[str, Callable[[InteractionStep], None]], ...] = (
+            ("cm-tree-connection-", self._activate_connection),
+            ("sql-manager-query-delete-", self._handle_click_delete),
+            (
+                "custom-select-item-sql_manager_export_destination-",
+                self._activate_export_destination_option,
             ),
-            "sql-manager-minimize": self.sql_manager_page.minimize,
-            "sql-manager-toggle-left-panel": self.sql_manager_page.toggle_left_panel_panel,
-        }
+            ("sql-codemirror-", self._route_codemirror_click),
+            ("sql-manager-query-editor-", self._route_codemirror_click),
+        )
+
+    def _install_replay_bootstrap(self) -> None:
+        """Registers window.__replay in every new document via CDP (best effort)."""
+        try:
+            self.driver.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": _JS_REPLAY_BOOTSTRAP},
+            )
+        except Exception:
+            self.logger.debug(
+                "CDP script preload unavailable; inline JS fallbacks stay active"
+            )
 
     # ---------- public API ----------
     def prepare_plugin_home(self) -> None:
@@ -216,8 +501,6 @@ class InteractionLogExecutor:
         use_last_session: bool = False,
         stop_on_error: bool = True,
     ) -> list[ReplayFailure]:
-        steps = read_interaction_log(log_path)
-
         if use_last_session:
             self.logger.warning(
                 "use_last_session is ignored in v1; replay uses full file order"
@@ -226,7 +509,12 @@ class InteractionLogExecutor:
         if prepare_plugin_home:
             self.prepare_plugin_home()
 
-        return self.replay_steps(steps, stop_on_error=stop_on_error)
+        # Streaming: parse line-by-line so Selenium work overlaps with parsing.
+        # Keyboard events are dropped at parse time; replay never acts on them.
+        return self.replay_steps(
+            iter_interaction_log(log_path, skip_keyboard=True),
+            stop_on_error=stop_on_error,
+        )
 
     def replay_steps(
         self,
@@ -250,13 +538,34 @@ class InteractionLogExecutor:
                     raise RuntimeError(message) from exc
                 self.logger.exception(message)
 
+        self._flush_pending_ops()
         return failures
 
     def execute_step(self, step: InteractionStep) -> None:
-        handler = self._handlers.get(step.action_key)
-        if handler:
-            handler(step)
-            return
+        # Inlined dispatch ladder (click dominates real logs): avoids the
+        # tuple build + dict probe of a handler table on every step.
+        event = step.event
+        if event == "click":
+            self._flush_pending_ops()
+            action = step.action
+            if action == "activate":
+                return self._handle_click_activate(step)
+            if action == "preview":
+                return self._handle_click_preview(step)
+            if action == "export":
+                return self._handle_click_export(step)
+            if action == "delete":
+                return self._handle_click_delete(step)
+        elif event == "input":
+            if step.action == "set-value":
+                return self._handle_input_set_value(step)
+        elif event == "change":
+            if step.action == "set-value":
+                # change/set-value replays identically to input/set-value
+                return self._handle_input_set_value(step)
+        elif event == "codemirror-change":
+            if step.action == "set-value":
+                return self._handle_codemirror_set_value(step)
         self._handle_unmapped_action(step)
 
     def close(self) -> None:
@@ -276,18 +585,20 @@ class InteractionLogExecutor:
         if self._dispatch_click_route(step):
             self._sync_active_card_from_page()
             return
-        if self._is_connection_item(step):
-            self._activate_connection(step)
-            return
-        if self._is_query_delete_button(step):
-            self._handle_click_delete(step)
-            return
-        if self._is_export_destination_option(step):
-            self._activate_export_destination_option(step)
-            return
-        if self._is_codemirror_target(step) and self._activate_codemirror(step):
-            return
 
+        tid = step.test_id
+        if tid:
+            for prefix, handler in self._prefix_routes:
+                if tid.startswith(prefix):
+                    handler(step)
+                    return
+
+        self._click_generic(step)
+        self._remember_active_card(step)
+
+    def _route_codemirror_click(self, step: InteractionStep) -> None:
+        if self._activate_codemirror(step):
+            return
         self._click_generic(step)
         self._remember_active_card(step)
 
@@ -307,23 +618,18 @@ class InteractionLogExecutor:
 
     def _handle_input_set_value(self, step: InteractionStep) -> None:
         if self._is_query_name_input(step):
+            self._flush_pending_ops()
             self.sql_manager_page.enter_query_name(step.value or "")
             return
         if self._is_export_destination_select(step):
-            self._set_export_destination(step)
-            return
-        self._set_value_generic(step)
-
-    def _handle_change_set_value(self, step: InteractionStep) -> None:
-        if self._is_query_name_input(step):
-            self.sql_manager_page.enter_query_name(step.value or "")
-            return
-        if self._is_export_destination_select(step):
+            self._flush_pending_ops()
             self._set_export_destination(step)
             return
         self._set_value_generic(step)
 
     def _handle_codemirror_set_value(self, step: InteractionStep) -> None:
+        if self._queue_set_value(step, "setCM"):
+            return
         card = self._resolve_card(step, required=False)
         if card:
             self.sql_manager_page.set_query_text(step.value or "")
@@ -331,6 +637,7 @@ class InteractionLogExecutor:
         self._set_codemirror_generic(step)
 
     def _handle_unmapped_action(self, step: InteractionStep) -> None:
+        self._flush_pending_ops()
         if step.event in KEYBOARD_EVENTS:
             self.logger.debug("Skipping keyboard event at line=%s", step.index)
             return
@@ -355,9 +662,19 @@ class InteractionLogExecutor:
         if not test_id:
             return False
 
-        exact = self._exact_click_routes.get(test_id)
-        if exact:
-            exact()
+        override = self._exact_click_overrides.get(test_id)
+        if override:
+            override()
+            return True
+
+        route = _EXACT_CLICK_ROUTES.get(test_id)
+        if route:
+            page_attr, method_name, kwarg_attrs = route
+            method = getattr(getattr(self, page_attr), method_name)
+            if kwarg_attrs:
+                method(**{kw: getattr(self, attr) for kw, attr in kwarg_attrs})
+            else:
+                method()
             return True
 
         if test_id.startswith("main-"):
@@ -373,6 +690,12 @@ class InteractionLogExecutor:
 
         return False
 
+    def _confirm_export_bound(self) -> Any:
+        return self.sql_manager_page.confirm_export(timeout=self.export_timeout)
+
+    def _click_success_ok_bound(self) -> Any:
+        return self.sql_manager_page.click_success_ok(timeout=self.success_timeout)
+
     @staticmethod
     def _call_noarg(page_obj: Any, method_name: str) -> bool:
         method = getattr(page_obj, method_name, None)
@@ -439,14 +762,70 @@ class InteractionLogExecutor:
             )
         self.sql_manager_page._click_locator(locator)
 
+    # ---------- batched set-value ops ----------
+    def _queue_set_value(self, step: InteractionStep, kind: str) -> bool:
+        """Buffers a generic set op when it can be expressed as a CSS query."""
+        locator = self._locator_from_step(step)
+        if not locator or locator[0] != By.CSS_SELECTOR:
+            return False
+        self._pending_ops.append(
+            {
+                "kind": kind,
+                "selector": locator[1],
+                "value": step.value or "",
+                "index": step.index,
+            }
+        )
+        if len(self._pending_ops) >= 16:
+            self._flush_pending_ops()
+        return True
+
+    def _flush_pending_ops(self) -> None:
+        if not self._pending_ops:
+            return
+        ops = self._pending_ops
+        self._pending_ops = []
+        failed = self.driver.driver.execute_script(_JS_APPLY_OPS, ops)
+        if failed is None or failed < 0:
+            return
+        # The batch applier queries only the current frame; an op whose target
+        # lives in another iframe fails there even though the unbatched path
+        # would have found it. Replay the failed op and everything after it
+        # through the frame-walking fallback before giving up.
+        for op in ops[failed:]:
+            self._apply_op_unbatched(op)
+
+    def _apply_op_unbatched(self, op: dict[str, Any]) -> None:
+        """Applies one buffered op via find_element_in_frames (slow path)."""
+        element = self.driver.find_element_in_frames(By.CSS_SELECTOR, op["selector"])
+        if not element:
+            raise RuntimeError(
+                f"Cannot apply buffered {op['kind']} at line={op['index']}: "
+                f"{op['selector']!r} not found in any frame"
+            )
+        if op["kind"] == "setCM":
+            applied = self.driver.driver.execute_script(
+                _JS_CODEMIRROR_SET, element, op["value"]
+            )
+            if not applied:
+                raise RuntimeError(
+                    f"Cannot apply buffered setCM at line={op['index']}"
+                )
+            return
+        self._apply_set_value(element, op["value"])
+
     def _set_value_generic(self, step: InteractionStep) -> None:
+        if self._queue_set_value(step, "setValue"):
+            return
+        self._flush_pending_ops()
         element = self._find_element(step)
         if not element:
             raise NoSuchElementException(
                 f"Cannot locate input element for line={step.index}"
             )
+        self._apply_set_value(element, step.value or "")
 
-        value = step.value or ""
+    def _apply_set_value(self, element: WebElement, value: str) -> None:
         tag = (element.tag_name or "").lower()
 
         if tag in {"input", "textarea"}:
@@ -458,17 +837,10 @@ class InteractionLogExecutor:
             self._set_select_value(element, value)
             return
 
-        self.driver.driver.execute_script(
-            """
-            arguments[0].value = arguments[1];
-            arguments[0].dispatchEvent(new Event('input', {bubbles:true}));
-            arguments[0].dispatchEvent(new Event('change', {bubbles:true}));
-            """,
-            element,
-            value,
-        )
+        self.driver.driver.execute_script(_JS_DISPATCH_INPUT_CHANGE, element, value)
 
     def _set_codemirror_generic(self, step: InteractionStep) -> None:
+        self._flush_pending_ops()
         element = self._find_element(step)
         if not element:
             raise NoSuchElementException(
@@ -476,37 +848,7 @@ class InteractionLogExecutor:
             )
 
         value = step.value or ""
-        applied = self.driver.driver.execute_script(
-            """
-            const host = arguments[0];
-            const value = arguments[1];
-            const candidates = [
-              host,
-              host.querySelector ? host.querySelector('.CodeMirror') : null,
-              host.closest ? host.closest('.CodeMirror') : null,
-            ];
-
-            for (const node of candidates) {
-              if (!node) continue;
-              if (node.CodeMirror) {
-                node.CodeMirror.setValue(value);
-                return true;
-              }
-            }
-
-            const ta = host.querySelector ? host.querySelector('textarea') : null;
-            if (ta) {
-              ta.value = value;
-              ta.dispatchEvent(new Event('input', {bubbles:true}));
-              ta.dispatchEvent(new Event('change', {bubbles:true}));
-              return true;
-            }
-
-            return false;
-            """,
-            element,
-            value,
-        )
+        applied = self.driver.driver.execute_script(_JS_CODEMIRROR_SET, element, value)
 
         if not applied:
             raise RuntimeError(f"Cannot apply codemirror value at line={step.index}")
@@ -535,16 +877,9 @@ class InteractionLogExecutor:
             try:
                 Select(element).select_by_visible_text(value)
             except Exception:
-                self.driver.driver.execute_script(
-                    "arguments[0].value = arguments[1];",
-                    element,
-                    value,
-                )
+                self.driver.driver.execute_script(_JS_SET_VALUE, element, value)
 
-        self.driver.driver.execute_script(
-            "arguments[0].dispatchEvent(new Event('change', {bubbles:true}));",
-            element,
-        )
+        self.driver.driver.execute_script(_JS_DISPATCH_CHANGE, element)
 
     # ---------- card helpers ----------
     def _resolve_card(self, step: InteractionStep, *, required: bool) -> WebElement | None:
@@ -557,17 +892,12 @@ class InteractionLogExecutor:
             self.sql_manager_page.card = self._active_card
             return self._active_card
 
-        element = self._find_element(step)
-        if element:
-            card = self.driver.driver.execute_script(
-                "return arguments[0].closest('.query-card');",
-                element,
-            )
-            if card:
-                self._set_active_card(card)
-                return card
+        card = self._find_closest_card(step)
+        if card:
+            self._set_active_card(card)
+            return card
 
-        query_name = (step.raw.get("queryName") or "").strip()
+        query_name = (step.query_name or "").strip()
         connection_name = (step.connection_name or "").strip()
         if query_name or connection_name:
             try:
@@ -589,16 +919,32 @@ class InteractionLogExecutor:
         self._sync_active_card_from_page()
         if self._active_card:
             return
-        element = self._find_element(step)
-        if not element:
-            return
-        card = self.driver.driver.execute_script(
-            "return arguments[0].closest('.query-card');",
-            element,
-        )
+        card = self._find_closest_card(step)
         if card:
             self._set_active_card(card)
 
+    def _find_closest_card(self, step: InteractionStep) -> WebElement | None:
+        """
+        Resolves the enclosing .query-card in one wire call (querySelector +
+        closest fused in the current frame), falling back to the frame-walking
+        two-step lookup when the fused query misses.
+        """
+        locator = self._locator_from_step(step)
+        if locator and locator[0] == By.CSS_SELECTOR:
+            try:
+                card = self.driver.driver.execute_script(
+                    _JS_QUERY_CLOSEST_CARD, locator[1]
+                )
+            except Exception:
+                card = None
+            if card:
+                return card
+
+        element = self._find_element(step)
+        if not element:
+            return None
+        return self.driver.driver.execute_script(_JS_CLOSEST_QUERY_CARD, element)
+
     @staticmethod
     def _element_is_alive(element: WebElement) -> bool:
         try:
@@ -609,75 +955,61 @@ class InteractionLogExecutor:
 
     # ---------- locator helpers ----------
     def _find_element(self, step: InteractionStep) -> WebElement | None:
+        if step.page != self._last_page:
+            # Navigation between plugin screens invalidates cached elements.
+            if self._last_page is not None:
+                self._element_cache.clear()
+            self._last_page = step.page
+
+        key = step.test_id or step.selector or step.element_id
+        if key:
+            cached = self._element_cache.get(key)
+            if cached is not None:
+                if self._element_is_alive(cached):
+                    return cached
+                del self._element_cache[key]
+
         locator = self._locator_from_step(step)
         if not locator:
             return None
         by, selector = locator
-        return self.driver.find_element_in_frames(by, selector)
+        element = self.driver.find_element_in_frames(by, selector)
+        if key and element is not None:
+            self._element_cache[key] = element
+        return element
 
-    @staticmethod
-    def _locator_from_step(step: InteractionStep) -> tuple[str, str] | None:
+    def _locator_from_step(self, step: InteractionStep) -> tuple[str, str] | None:
         if step.selector:
             return By.CSS_SELECTOR, step.selector
         if step.test_id:
-            safe = step.test_id.replace("'", "\\'")
-            return By.CSS_SELECTOR, f"[data-testid='{safe}']"
+            locator = self._locator_cache.get(step.test_id)
+            if locator is None:
+                safe = step.test_id.replace("'", "\\'")
+                locator = (By.CSS_SELECTOR, f"[data-testid='{safe}']")
+                self._locator_cache[step.test_id] = locator
+            return locator
         if step.element_id:
             return By.ID, step.element_id
         return None
 
     # ---------- recognizers ----------
     @staticmethod
-    def _is_testid_prefix(step: InteractionStep, prefix: str) -> bool:
-        if not step.test_id:
-            return False
-        return step.test_id == prefix or step.test_id.startswith(prefix + "-")
-
-    def _is_query_name_input(self, step: InteractionStep) -> bool:
-        return (
-            step.element_id == "dialog-menu-name-sqlreq"
-            or self._is_testid_prefix(step, "dialog-menu-name-sqlreq")
-            or self._is_testid_prefix(step, "sql-manager-add-query-name")
-        )
-
-    def _is_export_destination_select(self, step: InteractionStep) -> bool:
-        return (
-            step.element_id == "export-destination-select"
-            or self._is_testid_prefix(step, "export-destination-select")
-            or self._is_testid_prefix(step, "sql-manager-export-destination")
+    def _is_query_name_input(step: InteractionStep) -> bool:
+        return step.element_id == "dialog-menu-name-sqlreq" or (
+            step.test_id is not None
+            and _classify_testid(step.test_id) == "query_name"
         )
 
     @staticmethod
-    def _is_export_destination_option(step: InteractionStep) -> bool:
-        return bool(
-            step.test_id
-            and step.test_id.startswith("custom-select-item-sql_manager_export_destination-")
-        )
-
-    @staticmethod
-    def _is_connection_item(step: InteractionStep) -> bool:
-        return bool(step.test_id and step.test_id.startswith("cm-tree-connection-"))
-
-    @staticmethod
-    def _is_query_delete_button(step: InteractionStep) -> bool:
-        return bool(step.test_id and step.test_id.startswith("sql-manager-query-delete-"))
-
-    @staticmethod
-    def _is_codemirror_target(step: InteractionStep) -> bool:
-        return bool(
-            step.test_id
-            and (
-                step.test_id.startswith("sql-codemirror-")
-                or step.test_id.startswith("sql-manager-query-editor-")
-            )
+    def _is_export_destination_select(step: InteractionStep) -> bool:
+        return step.element_id == "export-destination-select" or (
+            step.test_id is not None
+            and _classify_testid(step.test_id) == "export_dest"
         )
 
     @staticmethod
     def _clean_connection_title(value: str | None) -> str:
-        text = (value or "").replace("\u200b", "").strip()
-        for prefix in ("▶", "▸", "►"):
-            text = text.lstrip(prefix).strip()
-        return text
+        return (value or "").translate(_TITLE_STRIP_TABLE).strip()
 
     @staticmethod
     def _infer_export_destination_value(text: str | None) -> str | None:
@@ -759,8 +1091,7 @@ def main(argv: list[str] | None = None) -> int:
     if not log_path.exists():
         parser.error(f"Log file not found: {log_path}")
 
-    steps = read_interaction_log(log_path)
-    print(f"[log] file={log_path} lines={len(steps)}")
+    print(f"[log] file={log_path} lines={count_interaction_log_lines(log_path)}")
 
     if args.dry_parse:
         return 0
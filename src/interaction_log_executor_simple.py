@@ -10,11 +10,20 @@ Design goals:
 from __future__ import annotations
 
 import argparse
+import enum
+import multiprocessing
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Callable
 
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 
 from .driver import DriverOnlyOffice
 from .interaction_log_executor import (
@@ -30,6 +39,59 @@ from .pages.sql_mode_page import SqlModePage
 from .utils.logging_utils import get_logger
 
 
+class StepResult(enum.Enum):
+    """Outcome of a single replayed step, branched on without exceptions."""
+
+    OK = "ok"
+    SKIPPED = "skipped"
+    UNHANDLED = "unhandled"
+    FAIL = "fail"
+
+
+class _Call0:
+    """Route adapter that drops the step argument for zero-argument clicks."""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+
+    def __call__(self, _step: "InteractionStep") -> None:
+        self.fn()
+
+
+@lru_cache(maxsize=4096)
+def _testid_css(test_id: str) -> str:
+    """Memoized [data-testid=...] selector string for repeated testIds."""
+    return "[data-testid='%s']" % test_id.replace("'", "\\'")
+
+
+#: Raw-JSON rule keys mapped to InteractionStep attribute names.
+_FIELD_ALIASES = {
+    "testId": "test_id",
+    "elementId": "element_id",
+    "id": "element_id",
+    "queryKey": "query_key",
+    "connectionName": "connection_name",
+}
+
+
+@lru_cache(maxsize=None)
+def _field_getter(key: str) -> Callable[[InteractionStep], Any]:
+    """
+    Accessor for a rule key, resolved once per unique key instead of on every
+    rule x step evaluation: alias lookup, raw.-prefix parsing and the
+    membership probe against InteractionStep._fields all happen here.
+    """
+    resolved = _FIELD_ALIASES.get(key, key)
+    if resolved.startswith("raw."):
+        raw_key = resolved.split(".", 1)[1]
+        return lambda step: step.to_dict().get(raw_key)
+    if resolved in InteractionStep._fields:
+        return attrgetter(resolved)
+    return lambda step: step.to_dict().get(key)
+
+
 class SimpleInteractionLogExecutor:
     """
     Minimal replay executor:
@@ -37,6 +99,34 @@ class SimpleInteractionLogExecutor:
     - if route is missing, does generic click;
     - keeps only lightweight helpers for inputs/select/codemirror.
     """
+
+    # Fixed attribute set: no per-instance __dict__, slightly faster
+    # attribute access in the replay loop.
+    __slots__ = (
+        "driver",
+        "home_page",
+        "editor_page",
+        "plugin_page",
+        "sql_mode_page",
+        "sql_manager_page",
+        "logger",
+        "preview_timeout",
+        "export_timeout",
+        "success_timeout",
+        "click_routes_exact",
+        "click_routes_prefix",
+        "skip_rules",
+        "_compiled_skip",
+        "_el_cache",
+        "_prefix_key_len",
+        "_prefix_buckets",
+        "_last_error",
+    )
+
+    #: Step fields a skip rule may reference for the warmed-up flat dispatch
+    #: table to stay correct (its key is exactly this triple).
+    _FLAT_KEY_FIELDS = frozenset({"event", "action", "test_id"})
+
     DEFAULT_SKIP_RULES: list[dict[str, Any]] = [
         {
             "event": "input",
@@ -55,13 +145,19 @@ class SimpleInteractionLogExecutor:
         driver: DriverOnlyOffice | None = None,
         *,
         debugger_address: str = "127.0.0.1:9222",
+        headless: bool = False,
+        block_images: bool = False,
         home_page: HomePage | None = None,
         editor_page: EditorPage | None = None,
         plugin_page: PluginPage | None = None,
         sql_mode_page: SqlModePage | None = None,
         sql_manager_page: SqlManagerPage | None = None,
     ):
-        self.driver = driver or DriverOnlyOffice(debugger_address=debugger_address)
+        self.driver = driver or DriverOnlyOffice(
+            debugger_address=debugger_address,
+            headless=headless,
+            block_images=block_images,
+        )
         self.home_page = home_page or HomePage(self.driver)
         self.editor_page = editor_page or EditorPage(self.driver)
         self.plugin_page = plugin_page or PluginPage(self.driver)
@@ -77,7 +173,30 @@ class SimpleInteractionLogExecutor:
             self.click_routes_exact,
             self.click_routes_prefix,
         ) = self._build_click_routes()
-        self.skip_rules: list[dict[str, Any]] = [dict(r) for r in self.DEFAULT_SKIP_RULES]
+        # locator -> WebElement for testIds that repeat throughout a log;
+        # flushed when a mode-change route navigates to another screen.
+        self._el_cache: dict[tuple[str, str], WebElement] = {}
+
+        # Prefix routes bucketed by a fixed-length key so dispatch is one dict
+        # probe plus (usually) a single startswith instead of a linear scan.
+        self._prefix_key_len = min(len(p) for p in self.click_routes_prefix)
+        self._prefix_buckets: dict[
+            str, list[tuple[str, Callable[[InteractionStep], None]]]
+        ] = {}
+        for prefix, handler in self.click_routes_prefix.items():
+            self._prefix_buckets.setdefault(
+                prefix[: self._prefix_key_len], []
+            ).append((prefix, handler))
+        # Rules are frozen read-only views: matching never mutates them, so
+        # one copy at assignment replaces a defensive dict() per access.
+        self.skip_rules: tuple[MappingProxyType, ...] = tuple(
+            MappingProxyType(dict(r)) for r in self.DEFAULT_SKIP_RULES
+        )
+        self._compiled_skip: list[Callable[[InteractionStep], bool]] = [
+            self._compile_rule(rule) for rule in self.skip_rules
+        ]
+        # Exception that made execute_step() return StepResult.FAIL.
+        self._last_error: Exception | None = None
 
     # ---------- public API ----------
     def prepare_plugin_home(self) -> None:
@@ -92,41 +211,204 @@ class SimpleInteractionLogExecutor:
         prepare_plugin_home: bool = True,
         stop_on_error: bool = True,
     ) -> None:
-        steps = read_interaction_log(log_path)
+        steps = self._load_steps(log_path)
         if prepare_plugin_home:
             self.prepare_plugin_home()
         self.replay_steps(steps, stop_on_error=stop_on_error)
 
+    def _load_steps(self, log_path: str | Path) -> list[InteractionStep]:
+        """
+        Bulk-parse fast path: reads the whole file at once, decodes each line
+        with orjson and drops skip-rule matches at the dict level before any
+        InteractionStep is constructed. Falls back to read_interaction_log
+        when orjson is not installed. Rules that cannot be evaluated on raw
+        dicts (callables) are left to the per-step skip check, so pre-filtering
+        only ever removes steps the replay would skip anyway.
+        """
+        try:
+            import orjson
+        except ImportError:
+            return read_interaction_log(log_path)
+
+        path = Path(log_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Interaction log not found: {path}")
+        raw_filters = [
+            compiled
+            for compiled in (
+                self._compile_raw_rule(rule) for rule in self.skip_rules
+            )
+            if compiled is not None
+        ]
+        data = path.read_bytes()
+        if data[:3] == b"\xef\xbb\xbf":
+            data = data[3:]
+        loads = orjson.loads
+        from_raw = InteractionStep.from_raw
+        steps: list[InteractionStep] = []
+        for line_number, line in enumerate(data.splitlines(), start=1):
+            payload = line.strip()
+            if not payload:
+                continue
+            try:
+                raw = loads(payload)
+            except ValueError as exc:
+                raise ValueError(f"Invalid JSON at {path}:{line_number}") from exc
+            if not isinstance(raw, dict):
+                raise ValueError(
+                    f"JSON line must be an object at {path}:{line_number}"
+                )
+            if any(matches(raw) for matches in raw_filters):
+                continue
+            steps.append(from_raw(raw, index=line_number))
+        return steps
+
+    def replay_many(
+        self,
+        log_paths: list[str | Path],
+        *,
+        stop_on_error: bool = True,
+    ) -> None:
+        """
+        Реплей нескольких логов на одной сессии браузера: prepare_plugin_home
+        выполняется один раз, между логами страница обновляется вместо
+        перезапуска драйвера.
+        """
+        first = True
+        for log_path in log_paths:
+            if not first:
+                self.driver.driver.refresh()
+            self.replay_file(
+                log_path,
+                prepare_plugin_home=first,
+                stop_on_error=stop_on_error,
+            )
+            first = False
+
     def replay_steps(
         self,
         steps: list[InteractionStep],
         *,
         stop_on_error: bool = True,
     ) -> None:
+        steps = self._coalesce_steps(steps)
+        flat = self._warmup(steps)
         for step in steps:
-            try:
-                self.execute_step(step)
-            except Exception as exc:
-                message = (
-                    f"Replay failed on line={step.index}, seq={step.seq}, "
-                    f"event={step.event}/{step.action}, testId={step.test_id}"
-                )
-                if stop_on_error:
-                    raise RuntimeError(message) from exc
-                self.logger.exception(message)
+            if flat is not None:
+                handler = flat[step.event, step.action, step.test_id]
+                if handler is None:
+                    continue
+                try:
+                    handler(step)
+                    continue
+                except Exception as exc:
+                    self._last_error = exc
+            elif self.execute_step(step) is not StepResult.FAIL:
+                continue
+            message = (
+                f"Replay failed on line={step.index}, seq={step.seq}, "
+                f"event={step.event}/{step.action}, testId={step.test_id}"
+            )
+            if stop_on_error:
+                raise RuntimeError(message) from self._last_error
+            self.logger.error("%s: %r", message, self._last_error)
 
-    def execute_step(self, step: InteractionStep) -> None:
+    @staticmethod
+    def _coalesce_steps(steps: list[InteractionStep]) -> list[InteractionStep]:
+        """
+        Collapses runs of consecutive incremental value updates - CodeMirror
+        typing streams (sql-manager-query-editor-*) and the add-query name
+        input - down to the run's final step. Only the last value matters;
+        replaying every keystroke costs one WebDriver round trip each.
+        """
+        out: list[InteractionStep] = []
+        prev_key: tuple[str, str, str] | None = None
+        for step in steps:
+            test_id = step.test_id or ""
+            if (
+                test_id.startswith("sql-manager-query-editor-")
+                or test_id == "sql-manager-add-query-name"
+            ):
+                key = (step.event, step.action, test_id)
+                if prev_key == key:
+                    out[-1] = step
+                    continue
+                prev_key = key
+            else:
+                prev_key = None
+            out.append(step)
+        return out
+
+    def _warmup(
+        self, steps: list[InteractionStep]
+    ) -> dict[tuple[str, str, str], Callable[[InteractionStep], None] | None] | None:
+        """
+        Resolves every distinct (event, action, testId) triple through the
+        skip/exact/prefix/fallback chain once, so the replay loop does a
+        single dict lookup per step. Returns None (warmup disabled) when a
+        skip rule depends on fields outside the triple and memoizing by it
+        would change which steps get skipped.
+        """
+        for matches in self._compiled_skip:
+            fields = getattr(matches, "fields", None)
+            if fields is None or not fields <= self._FLAT_KEY_FIELDS:
+                return None
+        flat: dict[
+            tuple[str, str, str], Callable[[InteractionStep], None] | None
+        ] = {}
+        for step in steps:
+            key = (step.event, step.action, step.test_id)
+            if key not in flat:
+                flat[key] = self._resolve_handler(step)
+        return flat
+
+    def _resolve_handler(
+        self, step: InteractionStep
+    ) -> Callable[[InteractionStep], None] | None:
+        """One-time route resolution for _warmup; mirrors execute_step."""
         if self._should_skip_step(step):
-            return
-        if self._dispatch_by_test_id(step):
-            return
+            return None
+        test_id = step.test_id or ""
+        if test_id:
+            exact = self.click_routes_exact.get(test_id)
+            if exact:
+                if test_id.startswith(("main-", "sql-home-open-")):
+
+                    def handler(s, _exact=exact):
+                        self._el_cache.clear()
+                        _exact(s)
+
+                    return handler
+                return exact
+            bucket = self._prefix_buckets.get(test_id[: self._prefix_key_len])
+            if bucket:
+                for prefix, prefix_handler in bucket:
+                    if test_id.startswith(prefix):
+                        return prefix_handler
         if step.event == "click":
-            self._click_generic(step)
-            return
+            return self._click_generic
+        self.logger.debug(
+            "Skip event/action=%s/%s testId=%s", step.event, step.action, test_id
+        )
+        return None
+
+    def execute_step(self, step: InteractionStep) -> StepResult:
+        if self._should_skip_step(step):
+            return StepResult.SKIPPED
+        try:
+            if self._dispatch_by_test_id(step):
+                return StepResult.OK
+            if step.event == "click":
+                self._click_generic(step)
+                return StepResult.OK
+        except Exception as exc:
+            self._last_error = exc
+            return StepResult.FAIL
 
         self.logger.debug(
             "Skip line=%s event/action=%s/%s", step.index, step.event, step.action
         )
+        return StepResult.UNHANDLED
 
     def close(self) -> None:
         try:
@@ -141,11 +423,13 @@ class SimpleInteractionLogExecutor:
         self.close()
 
     def set_skip_rules(self, rules: list[dict[str, Any]]) -> None:
-        self.skip_rules = [dict(rule) for rule in rules]
+        self.skip_rules = tuple(MappingProxyType(dict(rule)) for rule in rules)
+        self._compiled_skip = [self._compile_rule(rule) for rule in self.skip_rules]
 
     def add_skip_rule(self, **rule: Any) -> None:
         if rule:
-            self.skip_rules.append(rule)
+            self.skip_rules = self.skip_rules + (MappingProxyType(rule),)
+            self._compiled_skip.append(self._compile_rule(rule))
 
     # ---------- routes ----------
     def _build_click_routes(
@@ -155,50 +439,36 @@ class SimpleInteractionLogExecutor:
         dict[str, Callable[[InteractionStep], None]],
     ]:
         exact: dict[str, Callable[[InteractionStep], None]] = {
-            "main-sql-mode": lambda _: self.plugin_page.click_main_sql_mode(),
-            "main-olap-mode": lambda _: self.plugin_page.click_main_olap_mode(),
-            "main-file-mode": lambda _: self.plugin_page.click_main_file_mode(),
-            "main-smartdocs": lambda _: self.plugin_page.click_main_smartdocs(),
-            "main-connection-manager": lambda _: self.plugin_page.click_main_connection_manager(),
-            "main-settings": lambda _: self.plugin_page.click_main_settings(),
-            "main-about": lambda _: self.plugin_page.click_main_about(),
-            "sql-home-open-sql-manager": lambda _: self.sql_mode_page.click_sql_manager(),
-            "sql-home-open-report-manager": lambda _: self.sql_mode_page.click_report_manager(),
-            "sql-home-open-query-history": lambda _: self.sql_mode_page.click_query_history(),
-            "sql-home-open-log": lambda _: self.sql_mode_page.click_log(),
-            "sql-manager-add-query-open": lambda _: self.sql_manager_page.click_add_query_button(),
-            "sql-manager-add-query-confirm": lambda _: self.sql_manager_page.confirm_add_query(),
-            "sql-manager-add-query-name": lambda step: self._set_query_name_from_step(step),
-            "sql-manager-export-confirm": lambda _: self.sql_manager_page.confirm_export(
-                timeout=self.export_timeout
-            ),
-            "sql-manager-export-destination": lambda step: self._set_export_destination_from_step(step),
-            "messagebox-button-OK-0": lambda _: self.sql_manager_page.click_success_ok(
-                timeout=self.success_timeout
-            ),
-            "sql-manager-minimize": lambda _: self.sql_manager_page.minimize(),
-            "sql-manager-toggle-left-panel": lambda _: self.sql_manager_page.toggle_left_panel_panel(),
+            # Plain clicks go through the fused find+click script; routes with
+            # extra synchronization keep their page-object methods.
+            "main-sql-mode": self._fast_click,
+            "main-olap-mode": self._fast_click,
+            "main-file-mode": self._fast_click,
+            "main-smartdocs": self._fast_click,
+            "main-connection-manager": self._fast_click,
+            "main-settings": self._fast_click,
+            "main-about": self._fast_click,
+            "sql-home-open-sql-manager": _Call0(self.sql_mode_page.click_sql_manager),
+            "sql-home-open-report-manager": self._fast_click,
+            "sql-home-open-query-history": self._fast_click,
+            "sql-home-open-log": self._fast_click,
+            "sql-manager-add-query-open": _Call0(self.sql_manager_page.click_add_query_button),
+            "sql-manager-add-query-confirm": _Call0(self.sql_manager_page.confirm_add_query),
+            "sql-manager-add-query-name": self._set_query_name_from_step,
+            "sql-manager-export-confirm": self._route_confirm_export,
+            "sql-manager-export-destination": self._set_export_destination_from_step,
+            "messagebox-button-OK-0": self._route_success_ok,
+            "sql-manager-minimize": self._fast_click,
+            "sql-manager-toggle-left-panel": self._fast_click,
         }
 
         prefix: dict[str, Callable[[InteractionStep], None]] = {
-            "cm-tree-connection-": lambda step: (
-                self.sql_manager_page.select_connection((step.connection_name or "").strip())
-                if (step.connection_name or "").strip()
-                else self._click_generic(step)
-            ),
-            "sql-manager-query-preview-": lambda _step: self.sql_manager_page.click_query_preview(
-                timeout=self.preview_timeout
-            ),
-            "sql-manager-query-export-": lambda _step: self.sql_manager_page.click_export(),
-            "sql-manager-query-delete-": lambda _step: self._delete_active_query(),
-            "sql-manager-query-editor-": lambda step: self._set_query_text_from_step(step),
-            "custom-select-item-sql_manager_export_destination-": lambda step: (
-                self.sql_manager_page.select_export_destination(
-                    ((step.text or "").strip() or (step.value or "").strip())
-                )
-                if ((step.text or "").strip() or (step.value or "").strip())
-                else self._click_generic(step)
-            ),
+            "cm-tree-connection-": self._route_select_connection,
+            "sql-manager-query-preview-": self._route_query_preview,
+            "sql-manager-query-export-": _Call0(self.sql_manager_page.click_export),
+            "sql-manager-query-delete-": _Call0(self._delete_active_query),
+            "sql-manager-query-editor-": self._set_query_text_from_step,
+            "custom-select-item-sql_manager_export_destination-": self._route_export_destination_option,
         }
         return exact, prefix
 
@@ -209,49 +479,141 @@ class SimpleInteractionLogExecutor:
 
         exact = self.click_routes_exact.get(test_id)
         if exact:
+            if test_id.startswith(("main-", "sql-home-open-")):
+                self._el_cache.clear()
             exact(step)
             return True
 
-        for prefix, handler in self.click_routes_prefix.items():
-            if test_id.startswith(prefix):
-                handler(step)
-                return True
+        bucket = self._prefix_buckets.get(test_id[: self._prefix_key_len])
+        if bucket:
+            for prefix, handler in bucket:
+                if test_id.startswith(prefix):
+                    handler(step)
+                    return True
         return False
 
     def _should_skip_step(self, step: InteractionStep) -> bool:
-        for rule in self.skip_rules:
-            if self._rule_matches(step, rule):
-                self.logger.debug(
-                    "Skip line=%s by rule=%s", step.index, rule
-                )
+        for matches in self._compiled_skip:
+            if matches(step):
+                self.logger.debug("Skip line=%s by compiled rule", step.index)
                 return True
         return False
 
-    def _rule_matches(self, step: InteractionStep, rule: dict[str, Any]) -> bool:
+    @classmethod
+    def _compile_rule(
+        cls, rule: dict[str, Any]
+    ) -> Callable[[InteractionStep], bool]:
+        """
+        Partial-evaluates one rule dict: alias resolution and __startswith
+        parsing happen here once instead of on every step.
+        """
+        tests: list[Callable[[InteractionStep], bool]] = []
+        fields: list[str] = []
+        # Callable-правила получают весь step и могут читать любые его поля,
+        # поэтому их зависимости не выразимы списком имён.
+        unbounded = False
         for key, expected in rule.items():
-            field_key, op = self._parse_rule_key(key)
-            actual = self._get_step_field(step, field_key)
+            field_key, op = cls._parse_rule_key(key)
+            fields.append(cls._resolve_field_name(field_key))
+            if callable(expected):
+                unbounded = True
+            getter = _field_getter(field_key)
             if op == "startswith":
-                if actual is None:
-                    matched = False
-                elif isinstance(expected, (set, tuple, list)):
-                    matched = any(
-                        str(actual).startswith(str(prefix)) for prefix in expected
-                    )
+                if isinstance(expected, (set, tuple, list)):
+                    prefixes = tuple(str(prefix) for prefix in expected)
                 else:
-                    matched = str(actual).startswith(str(expected))
+                    prefixes = (str(expected),)
+
+                def test(step, _get=getter, _prefixes=prefixes):
+                    actual = _get(step)
+                    return actual is not None and str(actual).startswith(_prefixes)
+
             elif callable(expected):
-                try:
-                    matched = bool(expected(actual, step))
-                except TypeError:
-                    matched = bool(expected(actual))
+
+                def test(step, _get=getter, _fn=expected):
+                    try:
+                        return bool(_fn(_get(step), step))
+                    except TypeError:
+                        return bool(_fn(_get(step)))
+
             elif isinstance(expected, (set, tuple, list)):
-                matched = actual in expected
+
+                def test(step, _get=getter, _allowed=tuple(expected)):
+                    return _get(step) in _allowed
+
             else:
-                matched = actual == expected
-            if not matched:
-                return False
-        return True
+
+                def test(step, _get=getter, _expected=expected):
+                    return _get(step) == _expected
+
+            tests.append(test)
+
+        if not tests:
+            # An empty rule matched every step before; keep that contract.
+            matcher: Callable[[InteractionStep], bool] = lambda _step: True
+        elif len(tests) == 1:
+            matcher = tests[0]
+        else:
+            matcher = lambda step, _tests=tuple(tests): all(
+                t(step) for t in _tests
+            )
+        # Which step fields the rule reads; _warmup checks this set to decide
+        # whether skip decisions are a pure function of (event, action, testId).
+        # None = unbounded (callable rules), warmup must stay disabled.
+        matcher.fields = None if unbounded else frozenset(fields)
+        return matcher
+
+    @staticmethod
+    def _resolve_field_name(key: str) -> str:
+        return _FIELD_ALIASES.get(key, key)
+
+    @classmethod
+    def _compile_raw_rule(
+        cls, rule: dict[str, Any]
+    ) -> Callable[[dict[str, Any]], bool] | None:
+        """
+        Dict-level counterpart of _compile_rule for the bulk-parse path.
+        Keys are matched as written in the rule (raw JSON names, or the part
+        after a "raw." prefix); unknown keys simply never match, which keeps
+        pre-filtering conservative. Returns None for rules the raw level
+        cannot express (callable expectations need a constructed step).
+        """
+        tests: list[Callable[[dict[str, Any]], bool]] = []
+        for key, expected in rule.items():
+            if callable(expected):
+                return None
+            field_key, op = cls._parse_rule_key(key)
+            if field_key.startswith("raw."):
+                raw_key = field_key.split(".", 1)[1]
+            else:
+                raw_key = field_key
+            if op == "startswith":
+                if isinstance(expected, (set, tuple, list)):
+                    prefixes = tuple(str(prefix) for prefix in expected)
+                else:
+                    prefixes = (str(expected),)
+
+                def test(raw, _key=raw_key, _prefixes=prefixes):
+                    actual = raw.get(_key)
+                    return actual is not None and str(actual).startswith(_prefixes)
+
+            elif isinstance(expected, (set, tuple, list)):
+
+                def test(raw, _key=raw_key, _allowed=tuple(expected)):
+                    return raw.get(_key) in _allowed
+
+            else:
+
+                def test(raw, _key=raw_key, _expected=expected):
+                    return raw.get(_key) == _expected
+
+            tests.append(test)
+
+        if not tests:
+            return lambda _raw: True
+        if len(tests) == 1:
+            return tests[0]
+        return lambda raw, _tests=tuple(tests): all(t(raw) for t in _tests)
 
     @staticmethod
     def _parse_rule_key(key: str) -> tuple[str, str]:
@@ -260,23 +622,38 @@ class SimpleInteractionLogExecutor:
             return key[: -len(suffix)], "startswith"
         return key, "eq"
 
-    @staticmethod
-    def _get_step_field(step: InteractionStep, key: str) -> Any:
-        alias = {
-            "testId": "test_id",
-            "elementId": "element_id",
-            "id": "element_id",
-            "queryKey": "query_key",
-            "connectionName": "connection_name",
-        }
-        resolved = alias.get(key, key)
-        if resolved.startswith("raw."):
-            return step.raw.get(resolved.split(".", 1)[1])
-        if hasattr(step, resolved):
-            return getattr(step, resolved)
-        return step.raw.get(key)
-
     # ---------- generic helpers ----------
+    def _route_confirm_export(self, _step: InteractionStep) -> None:
+        self.sql_manager_page.confirm_export(timeout=self.export_timeout)
+
+    def _route_success_ok(self, _step: InteractionStep) -> None:
+        self.sql_manager_page.click_success_ok(timeout=self.success_timeout)
+
+    def _route_query_preview(self, _step: InteractionStep) -> None:
+        self.sql_manager_page.click_query_preview(timeout=self.preview_timeout)
+
+    def _route_select_connection(self, step: InteractionStep) -> None:
+        """Select a connection by its logged name; strips exactly once."""
+        name = (step.connection_name or "").strip()
+        if name:
+            self.sql_manager_page.select_connection(name)
+        else:
+            self._click_generic(step)
+
+    def _route_export_destination_option(self, step: InteractionStep) -> None:
+        """Pick an export-destination option by visible text (value fallback)."""
+        visible_text = (step.text or "").strip() or (step.value or "").strip()
+        if visible_text:
+            self.sql_manager_page.select_export_destination(visible_text)
+        else:
+            self._click_generic(step)
+
+    def _fast_click(self, step: InteractionStep) -> None:
+        """One-script click by testId; falls back to the locator path on miss."""
+        if step.test_id and self.plugin_page._click_by_testid(step.test_id):
+            return
+        self._click_generic(step)
+
     def _set_query_text_from_step(self, step: InteractionStep) -> None:
         if step.value is None:
             raise RuntimeError(
@@ -291,7 +668,7 @@ class SimpleInteractionLogExecutor:
         self.sql_manager_page.enter_query_name(value)
 
     def _set_export_destination_from_step(self, step: InteractionStep) -> None:
-        visible_text = ((step.text or "").strip() or (step.value or "").strip())
+        visible_text = (step.text or "").strip() or (step.value or "").strip()
         if not visible_text:
             return
         self.sql_manager_page.select_export_destination(visible_text)
@@ -302,7 +679,18 @@ class SimpleInteractionLogExecutor:
             raise NoSuchElementException(
                 f"Cannot build click locator for line={step.index}"
             )
-        self.sql_manager_page._click_locator(locator)
+        cached = self._el_cache.get(locator)
+        if cached is not None:
+            try:
+                # Same click helper as the cache-miss path: falls back to a JS
+                # click when the element is covered or not interactable.
+                self.sql_manager_page._click(cached)
+                return
+            except (StaleElementReferenceException, NoSuchElementException):
+                self._el_cache.pop(locator, None)
+        element = self.sql_manager_page._click_locator(locator)
+        if element is not None:
+            self._el_cache[locator] = element
 
     def _delete_active_query(self) -> None:
         self.sql_manager_page.click_query_delete()
@@ -313,12 +701,72 @@ class SimpleInteractionLogExecutor:
         if step.selector:
             return By.CSS_SELECTOR, step.selector
         if step.test_id:
-            safe = step.test_id.replace("'", "\\'")
-            return By.CSS_SELECTOR, f"[data-testid='{safe}']"
+            return By.CSS_SELECTOR, _testid_css(step.test_id)
         # if step.element_id:
         #     return By.ID, step.element_id
         return None
 
+# Lazily created executor shared across main() invocations with
+# --reuse-session: amortizes browser attach/startup over many replays.
+_EXECUTOR: SimpleInteractionLogExecutor | None = None
+
+
+def _get_shared_executor(debugger_address: str) -> SimpleInteractionLogExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = SimpleInteractionLogExecutor(debugger_address=debugger_address)
+    return _EXECUTOR
+
+
+# Debugger address of this pool worker, assigned once by _init_replay_worker.
+_WORKER_DEBUGGER_ADDRESS: str | None = None
+
+
+def _init_replay_worker(host: str, base_port: int, slot_counter) -> None:
+    """
+    Pool initializer: claims the next worker slot from the shared counter and
+    derives this process's debugger address as base_port + slot. Ports belong
+    to worker processes, not to individual logs, so --workers N needs exactly
+    N listening browsers no matter how many logs are queued.
+    """
+    global _WORKER_DEBUGGER_ADDRESS
+    with slot_counter.get_lock():
+        slot = slot_counter.value
+        slot_counter.value += 1
+    _WORKER_DEBUGGER_ADDRESS = f"{host}:{base_port + slot}"
+
+
+def _replay_one(
+    log_path: Path,
+    prepare_plugin_home: bool,
+    headless: bool,
+    block_images: bool,
+) -> int:
+    """
+    Pool-worker entry point: builds its own executor/driver against this
+    worker's debugger address, replays one log and returns an exit code like
+    main(). Arguments are positional so Pool.starmap can pickle the job tuples.
+    """
+    executor = SimpleInteractionLogExecutor(
+        debugger_address=_WORKER_DEBUGGER_ADDRESS,
+        headless=headless,
+        block_images=block_images,
+    )
+    try:
+        executor.replay_file(
+            log_path=log_path,
+            prepare_plugin_home=prepare_plugin_home,
+            stop_on_error=True,
+        )
+    except Exception as exc:
+        print(f"[replay-simple] {log_path} failed: {exc}")
+        return 2
+    finally:
+        executor.close()
+    print(f"[replay-simple] {log_path} completed successfully")
+    return 0
+
+
 def _build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Replay interaction-log-*.jsonl using simple dict-based routes."
@@ -326,12 +774,22 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--log",
         type=Path,
+        nargs="+",
         default=None,
         help=(
-            "Path to interaction log JSONL. Defaults to latest "
+            "Path(s) to interaction log JSONL. Defaults to latest "
             "interaction-log-*.jsonl in cwd."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Replay logs in N parallel processes; worker i attaches to the "
+            "debugger port base+i, so one browser must listen per worker."
+        ),
+    )
     parser.add_argument(
         "--debugger-address",
         default="127.0.0.1:9222",
@@ -342,6 +800,28 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not auto-open cell and plugin home before replay.",
     )
+    parser.add_argument(
+        "--reuse-session",
+        action="store_true",
+        help="Keep one executor/browser session alive across main() calls.",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help=(
+            "Expect a headless browser. Attach mode cannot toggle headless "
+            "itself: launch via scripts/start_onlyoffice.* with the headless "
+            "flag, otherwise the driver logs a warning."
+        ),
+    )
+    parser.add_argument(
+        "--no-images",
+        action="store_true",
+        help=(
+            "Expect image loading disabled at browser launch "
+            "(scripts/start_onlyoffice.ps1 -NoImages); see --headless."
+        ),
+    )
     return parser
 
 
@@ -349,26 +829,63 @@ def main(argv: list[str] | None = None) -> int:
     parser = _build_arg_parser()
     args = parser.parse_args(argv)
 
-    log_path = args.log or find_latest_interaction_log()
-    if not log_path:
-        parser.error(
-            "Log path is not provided and no interaction-log-*.jsonl was found in current directory."
+    log_paths = args.log
+    if not log_paths:
+        latest = find_latest_interaction_log()
+        if not latest:
+            parser.error(
+                "Log path is not provided and no interaction-log-*.jsonl was found in current directory."
+            )
+        log_paths = [latest]
+    for log_path in log_paths:
+        if not log_path.exists():
+            parser.error(f"Log file not found: {log_path}")
+
+    if args.workers > 1 and len(log_paths) > 1:
+        # Independent logs fan out across the pool; each worker process claims
+        # its own consecutive debugger port at startup, so the number of
+        # browsers needed equals the pool size, not the number of logs.
+        host, base_port = args.debugger_address.rsplit(":", 1)
+        workers = min(args.workers, len(log_paths))
+        slot_counter = multiprocessing.Value("i", 0)
+        jobs = [
+            (log_path, not args.no_prepare, args.headless, args.no_images)
+            for log_path in log_paths
+        ]
+        with multiprocessing.Pool(
+            workers,
+            initializer=_init_replay_worker,
+            initargs=(host, int(base_port), slot_counter),
+        ) as pool:
+            results = pool.starmap(_replay_one, jobs)
+        if any(results):
+            return 2
+        print("[replay-simple] completed successfully")
+        return 0
+
+    if args.reuse_session:
+        executor = _get_shared_executor(args.debugger_address)
+    else:
+        executor = SimpleInteractionLogExecutor(
+            debugger_address=args.debugger_address,
+            headless=args.headless,
+            block_images=args.no_images,
         )
-    if not log_path.exists():
-        parser.error(f"Log file not found: {log_path}")
-
-    executor = SimpleInteractionLogExecutor(debugger_address=args.debugger_address)
     try:
-        executor.replay_file(
-            log_path=log_path,
-            prepare_plugin_home=not args.no_prepare,
-            stop_on_error=True,
-        )
+        if len(log_paths) == 1:
+            executor.replay_file(
+                log_path=log_paths[0],
+                prepare_plugin_home=not args.no_prepare,
+                stop_on_error=True,
+            )
+        else:
+            executor.replay_many(log_paths, stop_on_error=True)
     except Exception as exc:
         print(f"[replay-simple] failed: {exc}")
         return 2
     finally:
-        executor.close()
+        if not args.reuse_session:
+            executor.close()
 
     print("[replay-simple] completed successfully")
     return 0
@@ -1,21 +1,107 @@
+import functools
+import time
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.relative_locator import RelativeBy
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.remote.webelement import WebElement
 
 from ..utils.logging_utils import get_logger
 from ..utils.visual import assert_screenshot
 
+def retry(
+    tries: int = 4,
+    base: float = 0.1,
+    excs: tuple[type[Exception], ...] = (
+        StaleElementReferenceException,
+        ElementClickInterceptedException,
+    ),
+):
+    """
+    Декоратор повтора с экспоненциальной паузой для действий, падающих из-за
+    перерисовки DOM (stale element, перехваченный клик). Один повтор действия
+    на порядки дешевле перезапуска всего сценария.
+    """
+
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(tries):
+                try:
+                    return fn(*args, **kwargs)
+                except excs:
+                    if attempt == tries - 1:
+                        raise
+                    time.sleep(base * (2 ** attempt))
+
+        return wrapper
+
+    return deco
+
+
+# Fused find+click: one execute_script instead of findElement + click round trips.
+_JS_CLICK_BY_TESTID = (
+    "var e = document.querySelector(\"[data-testid='\" + arguments[0] + \"']\");"
+    "if (!e) return false;"
+    "e.click();"
+    "return true;"
+)
+
+# То же самое для произвольного CSS-селектора.
+_JS_CLICK_BY_CSS = (
+    "var e = document.querySelector(arguments[0]);"
+    "if (!e) return false;"
+    "e.click();"
+    "return true;"
+)
+
+# Выбор option без Select(): обход options в Python стоит по round trip на
+# пункт, здесь вся работа и событие change выполняются одним скриптом.
+_JS_SELECT_BY_TEXT = """
+const sel = arguments[0], text = arguments[1];
+for (const opt of sel.options) {
+    if (opt.text.trim() === text) {
+        sel.value = opt.value;
+        sel.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+    }
+}
+return false;
+"""
+
+_JS_SELECT_BY_VALUE = """
+const sel = arguments[0], value = arguments[1];
+sel.value = value;
+sel.dispatchEvent(new Event('change', {bubbles: true}));
+return sel.value === value;
+"""
+
 
 class BasePage:
     """
     Базовый Page Object, использует find_element_in_frames для неявного поиска в iframe.
     """
 
+    #: Частота опроса ожиданий: дефолтные 0.5 c дают до полсекунды лишней
+    #: задержки на уже готовых элементах.
+    POLL_FREQUENCY = 0.05
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
     def __init__(self, driver, timeout: int = 10):
         self.driver = driver
-        self.wait = WebDriverWait(driver.driver, timeout)
+        self.wait = WebDriverWait(
+            driver.driver,
+            timeout,
+            poll_frequency=self.POLL_FREQUENCY,
+            ignored_exceptions=self.IGNORED_EXCEPTIONS,
+        )
         self.logger = get_logger(self.__class__.__name__.lower())
 
     def _log(self, message: str, *args, level: str = "info") -> None:
@@ -24,8 +110,20 @@ class BasePage:
             log_fn(message, *args)
 
     def _find(
-        self, by: str | RelativeBy = None, selector: str | None = None
+        self,
+        by: str | RelativeBy = None,
+        selector: str | None = None,
+        prefer_native: bool = True,
     ) -> WebElement:
+        if prefer_native:
+            # Одна нативная команда findElement в текущем фрейме: после
+            # предыдущего поиска контекст чаще всего уже правильный, и обход
+            # iframe вместе с Python-опросом ожидания не нужен вовсе.
+            try:
+                return self.driver.driver.find_element(by, selector)
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+
         def _locate(_):
             return self.driver.find_element_in_frames(by, selector)
 
@@ -42,25 +140,80 @@ class BasePage:
         def _locate(_):
             return self.driver.find_element_in_frames(by, selector)
 
-        el = WebDriverWait(self.driver.driver, timeout).until(_locate)
+        el = WebDriverWait(
+            self.driver.driver,
+            timeout,
+            poll_frequency=self.POLL_FREQUENCY,
+            ignored_exceptions=self.IGNORED_EXCEPTIONS,
+        ).until(_locate)
         if el is None:
             raise NoSuchElementException(
                 f"Элемент {by}='{selector}' не найден в iframe"
             )
         return el
 
+    def _click_by_testid(self, test_id: str) -> bool:
+        """
+        Кликает элемент по data-testid одним execute_script (поиск + клик в
+        текущем фрейме). Возвращает False, если элемент не найден.
+        """
+        try:
+            return bool(
+                self.driver.driver.execute_script(_JS_CLICK_BY_TESTID, test_id)
+            )
+        except Exception:
+            return False
+
+    def _js_click_css(self, css: str) -> bool:
+        """
+        Кликает первый элемент по CSS-селектору одним execute_script (поиск +
+        клик в текущем фрейме). Возвращает False, если элемент не найден.
+        """
+        try:
+            return bool(
+                self.driver.driver.execute_script(_JS_CLICK_BY_CSS, css)
+            )
+        except Exception:
+            return False
+
+    def _select_by_text_js(self, select_el: WebElement, text: str) -> bool:
+        """
+        Выбирает option по видимому тексту одним execute_script.
+        Возвращает False, если пункт не найден или скрипт не выполнился.
+        """
+        try:
+            return bool(
+                self.driver.driver.execute_script(
+                    _JS_SELECT_BY_TEXT, select_el, text
+                )
+            )
+        except Exception:
+            return False
+
+    def _select_by_value_js(self, select_el: WebElement, value: str) -> bool:
+        """Выбирает option по value одним execute_script; False при промахе."""
+        try:
+            return bool(
+                self.driver.driver.execute_script(
+                    _JS_SELECT_BY_VALUE, select_el, value
+                )
+            )
+        except Exception:
+            return False
+
     def _js_click(self, element: WebElement) -> None:
-        # self.driver.driver.execute_script(
-        #     "arguments[0].scrollIntoView({block:'center'});", element
-        # )
+        """Явный JS-клик: обходит перекрытия, но компилирует скрипт на каждый вызов."""
         self.driver.driver.execute_script("arguments[0].click();", element)
-        # element.click()
+
     def _click(self, element: WebElement) -> None:
-        # self.driver.driver.execute_script(
-        #     "arguments[0].scrollIntoView({block:'center'});", element
-        # )
-        self.driver.driver.execute_script("arguments[0].click();", element)
-        # element.click()
+        """
+        Нативный W3C-клик (одна команда, без компиляции скрипта);
+        при перекрытии/недоступности элемента откатывается на JS-клик.
+        """
+        try:
+            element.click()
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            self._js_click(element)
     def _find_locator(self, locator: tuple[str, str]) -> WebElement:
         by, selector = locator
         return self._find(by, selector)
@@ -133,7 +286,12 @@ class BasePage:
             return el
 
         try:
-            el = WebDriverWait(self.driver.driver, timeout).until(_ready)
+            el = WebDriverWait(
+                self.driver.driver,
+                timeout,
+                poll_frequency=self.POLL_FREQUENCY,
+                ignored_exceptions=self.IGNORED_EXCEPTIONS,
+            ).until(_ready)
             return el
         except TimeoutException:
             return None
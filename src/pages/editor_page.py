@@ -15,10 +15,10 @@ class EditorPage(BasePage):
         "//section[@id='plugins-panel']/div/span/button[descendant::*[text()='Слайдер'] and descendant::*[text()='Данные']]",
     )
     PLUGINS_TAB = (
-        By.XPATH,
-        "//ul[@role='tablist']/li[@data-layout-name='toolbar-plugins']/a",
+        By.CSS_SELECTOR,
+        "ul[role='tablist'] > li[data-layout-name='toolbar-plugins'] > a",
     )
-    CLOSE_BUTTON = (By.XPATH, "//div[@class='tool close']")
+    CLOSE_BUTTON = (By.CSS_SELECTOR, "div.tool.close")
 
     def open_plugins_tab(self) -> None:
         """
@@ -8,7 +8,10 @@ class HomePage(BasePage):
     Пример стартовой страницы (вне iframe).
     """
 
-    CREATION_CELL = (By.XPATH, "//div[@class='document-creation-grid']/div[@data-id='cell']")
+    CREATION_CELL = (
+        By.CSS_SELECTOR,
+        "div.document-creation-grid > div[data-id='cell']",
+    )
 
     def open_creation_cell(
         self,
@@ -1,44 +1,42 @@
-import time
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
-from .sql_manager_page import SqlManagerPage
+from .sql_mode_page import SqlModePage
 
 
 class PluginPage(BasePage):
     """Экран плагина с набором режимов/кнопок."""
 
     MAIN_SQL_MODE_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='main-sql-mode']",
+        By.CSS_SELECTOR,
+        "button[data-testid='main-sql-mode']",
     )
     MAIN_OLAP_MODE_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='main-olap-mode']",
+        By.CSS_SELECTOR,
+        "button[data-testid='main-olap-mode']",
     )
     MAIN_FILE_MODE_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='main-file-mode']",
+        By.CSS_SELECTOR,
+        "button[data-testid='main-file-mode']",
     )
     MAIN_SMARTDOCS_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='main-smartdocs']",
+        By.CSS_SELECTOR,
+        "button[data-testid='main-smartdocs']",
     )
     MAIN_CONNECTION_MANAGER_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='main-connection-manager']",
+        By.CSS_SELECTOR,
+        "button[data-testid='main-connection-manager']",
     )
     MAIN_SETTINGS_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='main-settings']",
+        By.CSS_SELECTOR,
+        "button[data-testid='main-settings']",
     )
     MAIN_ABOUT_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='main-about']",
+        By.CSS_SELECTOR,
+        "button[data-testid='main-about']",
     )
     CLOSE_PLUGIN_BUTTON = (
-        By.XPATH,
-        "//div[@id='panel-plugins-slider-query']//div[@class='plugin-close close']/button",
+        By.CSS_SELECTOR,
+        "#panel-plugins-slider-query .plugin-close.close button",
     )
 
     def __init__(self, driver):
@@ -51,7 +49,9 @@ class PluginPage(BasePage):
         """
         self._log("click_sql_mode")
         self._js_click_locator(self.MAIN_SQL_MODE_BUTTON)
-        time.sleep(0.1)
+        # Вместо фиксированной паузы ждём появления кнопки следующего экрана:
+        # на быстрой машине это почти мгновенное попадание первого опроса.
+        self._wait_locator(SqlModePage.SQL_MANAGER_BUTTON, timeout=2)
 
     def click_main_olap_mode(self) -> None:
         """
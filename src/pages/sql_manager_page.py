@@ -1,11 +1,157 @@
-import time
+import sys
+from functools import lru_cache
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.common.action_chains import ActionChains
 from typing import Optional
-from .base_page import BasePage
+from .base_page import BasePage, retry
+
+# Весь опрос готовности соединений за один execute_script: N запросов
+# get_attribute('class') на каждый тик ожидания превращаются в один round trip.
+_JS_CONNECTIONS_READY = """
+const items = arguments[0].querySelectorAll('li.connection-item');
+if (!items.length) return false;
+for (const li of items) {
+    const c = li.className;
+    if (!c.includes('connection-success') && !c.includes('connection-error')) {
+        return false;
+    }
+}
+return true;
+"""
+
+# Поиск соединения по заголовку целиком в браузере: N вызовов .text на
+# каждый элемент списка сворачиваются в один execute_script. Третий аргумент
+# выбирает, кликать по самому элементу или по его стрелке разворота.
+_JS_CLICK_CONNECTION = """
+const root = arguments[0], title = arguments[1], expand = arguments[2];
+for (const li of root.querySelectorAll('li.connection-item')) {
+    const span = li.querySelector('span.connection-title');
+    if (span && span.textContent.trim() === title) {
+        if (expand) {
+            const arrow = li.querySelector('span.expand-arrow');
+            if (arrow) arrow.click();
+        } else {
+            li.click();
+        }
+        return li;
+    }
+}
+return null;
+"""
+
+
+# Открытие диалога, ввод имени и подтверждение одним скриптом. Возвращает
+# null при успехе либо имя недостающего элемента для отката на пошаговый путь.
+_JS_ADD_QUERY = """
+const name = arguments[0];
+const open = document.querySelector("button[data-testid='sql-manager-add-query-open']");
+if (!open) return 'no-open-button';
+open.click();
+const input = document.querySelector("input[data-testid='sql-manager-add-query-name']");
+if (!input) return 'no-name-input';
+input.value = name;
+input.dispatchEvent(new Event('input', {bubbles: true}));
+input.dispatchEvent(new Event('change', {bubbles: true}));
+const confirm = document.querySelector("button[data-testid='sql-manager-add-query-confirm']");
+if (!confirm) return 'no-confirm-button';
+confirm.click();
+return null;
+"""
+
+
+# Установка текста запроса и клик по предпросмотру одной транзакцией.
+# Селектор кнопки ограничен тегом button, чтобы не зацепить
+# sql-manager-query-preview-container-*.
+_JS_SET_TEXT_AND_PREVIEW = """
+const card = arguments[0], text = arguments[1];
+const cmHost = card.querySelector('.CodeMirror');
+if (cmHost && cmHost.CodeMirror) {
+    cmHost.CodeMirror.setValue(text);
+} else {
+    const ta = card.querySelector('textarea');
+    if (!ta) return 'no-editor';
+    ta.value = text;
+    ta.dispatchEvent(new Event('input', {bubbles: true}));
+}
+const btn = card.querySelector("button[data-testid^='sql-manager-query-preview-']");
+if (!btn) return 'no-preview-button';
+btn.click();
+return null;
+"""
+
+
+# Проверка, что установленный текст реально применился в редакторе.
+_JS_QUERY_TEXT_APPLIED = """
+const container = arguments[0], text = arguments[1];
+const cmHost = container.querySelector('.CodeMirror');
+if (cmHost && cmHost.CodeMirror) return cmHost.CodeMirror.getValue() === text;
+const ta = container.querySelector('textarea');
+return !!ta && ta.value === text;
+"""
+
+# Проверка состояния карточки и клик по заголовку одним скриптом вместо
+# get_attribute('class') + отдельного клика (два round trip на операцию).
+_JS_TOGGLE_CARD = """
+const card = arguments[0], expand = arguments[1];
+const header =
+    card.querySelector("[data-testid^='sql-manager-query-card-header']") || card;
+if (expand) {
+    if ((card.className || '').includes('collapsed')) header.click();
+} else {
+    if ((header.className || '').includes('expanded')) header.click();
+}
+"""
+
+
+# Локаторы вынесены на уровень модуля с интернированными строками:
+# атрибуты класса ниже — алиасы, чтобы сигнатуры вызовов не менялись.
+_TOGGLE_LEFT_PANEL_BUTTON = (By.CSS_SELECTOR, sys.intern("button[data-testid='sql-manager-toggle-left-panel']"))
+_ADD_QUERY_OPEN_BUTTON = (By.CSS_SELECTOR, sys.intern("button[data-testid='sql-manager-add-query-open']"))
+_ADD_QUERY_NAME_INPUT = (By.CSS_SELECTOR, sys.intern("input[data-testid='sql-manager-add-query-name']"))
+_ADD_QUERY_CONFIRM_BUTTON = (By.CSS_SELECTOR, sys.intern("button[data-testid='sql-manager-add-query-confirm']"))
+_ADD_QUERY_CANCEL_BUTTON = (By.CSS_SELECTOR, sys.intern("button[data-testid='sql-manager-add-query-cancel']"))
+_FILTER_TYPE_SELECT = (By.CSS_SELECTOR, sys.intern("select[data-testid='sql-manager-filter-type']"))
+_FILTER_CONNECTION_SELECT = (By.CSS_SELECTOR, sys.intern("select[data-testid='sql-manager-filter-connection']"))
+_MINIMIZE_BUTTON = (By.CSS_SELECTOR, sys.intern("button[data-testid='sql-manager-minimize']"))
+_CONNECTION_LIST_UL = (By.CSS_SELECTOR, sys.intern("ul[data-testid='cm-tree-connections-list']"))
+_CONNECTION_ITEM = (By.CSS_SELECTOR, sys.intern("li.connection-item"))
+_CONNECTION_TITLE = (By.CSS_SELECTOR, sys.intern("span.connection-title"))
+_CONNECTION_ARROW = (By.CSS_SELECTOR, sys.intern("span.expand-arrow"))
+_QUERIES_CONTAINER = (By.CSS_SELECTOR, sys.intern("[data-testid='sql-manager-queries-container']"))
+_QUERY_CARD = (
+    By.CSS_SELECTOR,
+    sys.intern("div.query-card"),  # у каждой карточки есть data-query-name и data-query-key
+)
+_PREVIEW_LOADER = (By.CSS_SELECTOR, sys.intern("[data-testid^='sql-manager-query-preview-container-'] .local-loading-overlay"))
+_EXPORT_DEST_SELECT = (By.CSS_SELECTOR, sys.intern("[data-testid='sql-manager-export-destination']"))
+_EXPORT_CONFIRM_BTN = (By.CSS_SELECTOR, sys.intern("[data-testid='sql-manager-export-confirm']"))
+_EXPORT_CANCEL_BTN = (By.CSS_SELECTOR, sys.intern("[data-testid='sql-manager-export-cancel']"))
+_SUCCESS_TITLE = (By.CSS_SELECTOR, sys.intern("[data-testid='messagebox-title']"))
+_SUCCESS_TEXT = (By.CSS_SELECTOR, sys.intern("[data-testid='messagebox-body']"))
+_SUCCESS_OK_BTN = (By.CSS_SELECTOR, sys.intern("[data-testid='messagebox-button-OK-0']"))
+_QUERY_EDITOR_CONTAINER = (By.CSS_SELECTOR, sys.intern("[data-testid^='sql-manager-query-editor-']"))
+
+
+@lru_cache(maxsize=256)
+def _card_css(query_name: str | None, connection_name: str | None) -> str:
+    """
+    CSS-селектор карточки по паре (имя, соединение). Чистая функция на
+    горячем пути find_query_card — селектор собирается один раз на пару.
+    Модульная, а не метод: lru_cache на методе держал бы self живым.
+    """
+    css = "div.query-card"
+    if query_name:
+        css += f"[data-query-name='{query_name}']"
+    if connection_name:
+        css += f"[data-connection-name='{connection_name}']"
+    return css
 
 
 class SqlManagerPage(BasePage):
@@ -18,33 +164,36 @@ class SqlManagerPage(BasePage):
         super().__init__(driver, timeout=10)
         self.query_name = None
         self.card = None
+        # Прямая ссылка на raw-драйвер: self.driver.driver разыменовывается
+        # в этом классе тысячи раз за прогон.
+        self._d = driver.driver
+        # WebDriverWait на каждое значение таймаута создаётся один раз.
+        self._waits: dict[int, WebDriverWait] = {}
+        # Карточки запросов по (имя, соединение): повторные обращения к той же
+        # карточке идут через словарь вместо обхода фреймов.
+        self._card_cache: dict[tuple[str | None, str | None], WebElement] = {}
+
+    def _wait_for(self, timeout: int) -> WebDriverWait:
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(
+                self._d, timeout, poll_frequency=self.POLL_FREQUENCY
+            )
+            self._waits[timeout] = wait
+        return wait
 
-    TOGGLE_LEFT_PANEL_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-manager-toggle-left-panel']"
-    )
+    TOGGLE_LEFT_PANEL_BUTTON = _TOGGLE_LEFT_PANEL_BUTTON
 
     def toggle_left_panel_panel(self):
         """Кликает кнопку 'скрыть/показать боковую панель'."""
         self._log("toggle_tree_panel")
-        self._js_click_locator(self.TOGGLE_LEFT_PANEL_BUTTON)
-
-    ADD_QUERY_OPEN_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-manager-add-query-open']"
-    )
-    ADD_QUERY_NAME_INPUT = (
-        By.CSS_SELECTOR,
-        "input[data-testid='sql-manager-add-query-name']"
-    )
-    ADD_QUERY_CONFIRM_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-manager-add-query-confirm']"
-    )
-    ADD_QUERY_CANCEL_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-manager-add-query-cancel']"
-    )
+        if not self._js_click_css(self.TOGGLE_LEFT_PANEL_BUTTON[1]):
+            self._js_click_locator(self.TOGGLE_LEFT_PANEL_BUTTON)
+
+    ADD_QUERY_OPEN_BUTTON = _ADD_QUERY_OPEN_BUTTON
+    ADD_QUERY_NAME_INPUT = _ADD_QUERY_NAME_INPUT
+    ADD_QUERY_CONFIRM_BUTTON = _ADD_QUERY_CONFIRM_BUTTON
+    ADD_QUERY_CANCEL_BUTTON = _ADD_QUERY_CANCEL_BUTTON
 
     def add_query(self, query_name: str):
         """
@@ -56,6 +205,37 @@ class SqlManagerPage(BasePage):
         self.enter_query_name(query_name)
         self.confirm_add_query()
 
+    def add_query_fast(self, query_name: str, timeout: int = 5):
+        """
+        Быстрый вариант add_query: клик по кнопке, ввод имени и подтверждение
+        выполняются одной JS-транзакцией вместо трёх команд с ожиданиями,
+        затем одно ожидание появления карточки. Если диалог открывается не
+        синхронно, откатывается на пошаговый add_query.
+        """
+        self._log("add_query_fast %s", query_name)
+        # Закрепляем фрейм плагина перед execute_script.
+        self._find_locator(self.ADD_QUERY_OPEN_BUTTON)
+        error = self._d.execute_script(_JS_ADD_QUERY, query_name)
+        if error:
+            self._log("add_query_fast fallback: %s", error, level="warning")
+            self.add_query(query_name)
+            return self.card
+        self.query_name = query_name
+
+        def _card_appeared(_):
+            try:
+                return self.find_query_card(query_name)
+            except NoSuchElementException:
+                return False
+
+        try:
+            self._wait_for(timeout).until(_card_appeared)
+        except TimeoutException:
+            raise NoSuchElementException(
+                f"Query card '{query_name}' не появилась за {timeout}с"
+            )
+        return self.expand_query_card(query_name)
+
     def click_add_query_button(self):
         """Кликает по кнопке 'Добавить запрос'."""
         self._log("click_add_query_button")
@@ -75,56 +255,51 @@ class SqlManagerPage(BasePage):
     def confirm_add_query(self):
         """Подтверждает добавление запроса."""
         self._log("confirm_add_query")
-        self._js_click_locator(self.ADD_QUERY_CONFIRM_BUTTON)
+        if not self._js_click_css(self.ADD_QUERY_CONFIRM_BUTTON[1]):
+            self._js_click_locator(self.ADD_QUERY_CONFIRM_BUTTON)
         self.expand_query_card(self.query_name)
         # TODO: [EXTRA] добавить проверку на ошибку создания запроса, уточнить локатор для для ошибки 
 
     def cancel_add_query(self):
         """Отменяет добавление запроса."""
         self._log("cancel_add_query")
-        self._js_click_locator(self.ADD_QUERY_CANCEL_BUTTON)
+        if not self._js_click_css(self.ADD_QUERY_CANCEL_BUTTON[1]):
+            self._js_click_locator(self.ADD_QUERY_CANCEL_BUTTON)
 
 
-    FILTER_TYPE_SELECT = (
-        By.XPATH,
-        "//select[@data-testid='sql-manager-filter-type']"
-    )
+    FILTER_TYPE_SELECT = _FILTER_TYPE_SELECT
 
     def select_query_type(self, value: str = "all"):
         """Выбирает тип запросов в фильтре queryTypeFilter (all/htg/connection)."""
         self._log("select_query_type %s", value)
         select_el = self._find_locator(self.FILTER_TYPE_SELECT)
-        Select(select_el).select_by_value(value)
+        if not self._select_by_value_js(select_el, value):
+            Select(select_el).select_by_value(value)
 
 
-    FILTER_CONNECTION_SELECT = (
-        By.XPATH,
-        "//select[@data-testid='sql-manager-filter-connection']"
-    )
+    FILTER_CONNECTION_SELECT = _FILTER_CONNECTION_SELECT
 
     def select_connection_filter(self, value: str = "all"):
         """Выбирает соединение в фильтре connectionFilter (all или динамические значения)."""
         self._log("select_connection_filter %s", value)
         select_el = self._find_locator(self.FILTER_CONNECTION_SELECT)
-        Select(select_el).select_by_value(value)
+        if not self._select_by_value_js(select_el, value):
+            Select(select_el).select_by_value(value)
 
-    MINIMIZE_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-manager-minimize']"
-    )
+    MINIMIZE_BUTTON = _MINIMIZE_BUTTON
 
     def minimize(self):
         """Сворачивает окно SQL Manager."""
         self._log("minimize_sql_manager")
-        self._js_click_locator(self.MINIMIZE_BUTTON)
+        if not self._js_click_css(self.MINIMIZE_BUTTON[1]):
+            self._js_click_locator(self.MINIMIZE_BUTTON)
 
-    CONNECTION_LIST_UL = (
-        By.XPATH,
-        "//ul[@data-testid='cm-tree-connections-list']"
-    )
-    CONNECTION_ITEM = (By.XPATH, ".//li[contains(@class,'connection-item')]")
-    CONNECTION_TITLE = (By.XPATH, ".//span[contains(@class,'connection-title')]")
-    CONNECTION_ARROW = (By.XPATH, ".//span[contains(@class,'expand-arrow')]")
+    CONNECTION_LIST_UL = _CONNECTION_LIST_UL
+    # CSS внутри find_element(s) контекстного элемента и так ограничен его
+    # потомками — аналог ".//" не нужен.
+    CONNECTION_ITEM = _CONNECTION_ITEM
+    CONNECTION_TITLE = _CONNECTION_TITLE
+    CONNECTION_ARROW = _CONNECTION_ARROW
 
     def wait_connections_ready(self, timeout: int = 10) -> bool:
         """
@@ -132,22 +307,20 @@ class SqlManagerPage(BasePage):
         Возвращает True при успехе, бросает TimeoutException при превышении таймаута.
         """
         self._log("wait_connections_ready timeout=%s", timeout)
+        # Один поиск корня закрепляет нужный фрейм; дальше каждый тик — один
+        # execute_script вместо find_elements + get_attribute на каждый <li>.
+        list_root = self._find_locator(self.CONNECTION_LIST_UL)
 
         def _all_success(_):
-            list_root = self._find_locator(self.CONNECTION_LIST_UL)
-            items = list_root.find_elements(*self.CONNECTION_ITEM)
-            if not items:
+            nonlocal list_root
+            try:
+                return self._d.execute_script(_JS_CONNECTIONS_READY, list_root)
+            except StaleElementReferenceException:
+                list_root = self._find_locator(self.CONNECTION_LIST_UL)
                 return False
-            for li in items:
-                cls = li.get_attribute("class") or ""
-                if "connection-item" not in cls:
-                    return False
-                if "connection-success" not in cls and "connection-error" not in cls:
-                    return False
-            return True
 
         try:
-            WebDriverWait(self.driver.driver, timeout).until(_all_success)
+            self._wait_for(timeout).until(_all_success)
             return True
         except TimeoutException:
             raise TimeoutException(
@@ -158,105 +331,134 @@ class SqlManagerPage(BasePage):
         """Кликает по стрелке expand у соединения с указанным заголовком."""
         self._log("expand_connection %s", connection_title)
         list_root = self._find_locator(self.CONNECTION_LIST_UL)
-        items = list_root.find_elements(*self.CONNECTION_ITEM)
-        for li in items:
-            title_el = li.find_element(*self.CONNECTION_TITLE)
-            if title_el.text.strip() == connection_title:
-                try:
-                    arrow = li.find_element(*self.CONNECTION_ARROW)
-                    arrow.click()
-                except Exception:
-                    pass
-                return li
-        raise NoSuchElementException(f"Connection '{connection_title}' not found")
-
+        li = self._click_connection_js(list_root, connection_title, expand=True)
+        if li is None:
+            li = self._find_connection_item(list_root, connection_title)
+            # find_elements вместо try/except: у большинства соединений
+            # стрелки нет, пустой список дешевле исключения.
+            arrows = li.find_elements(*self.CONNECTION_ARROW)
+            if arrows:
+                arrows[0].click()
+        return li
+
+    @retry()
     def select_connection(self, connection_title: str):
         """Выбирает соединение (клик по элементу), разблокируя кнопку создания запроса."""
         self._log("select_connection %s", connection_title)
         list_root = self._find_locator(self.CONNECTION_LIST_UL)
-        items = list_root.find_elements(*self.CONNECTION_ITEM)
-        for li in items:
+        li = self._click_connection_js(list_root, connection_title)
+        if li is None:
+            li = self._find_connection_item(list_root, connection_title)
+            li.click()
+        self._wait_connection_selected(li)
+        return li
+
+    def _click_connection_js(
+        self, list_root: WebElement, connection_title: str, expand: bool = False
+    ) -> WebElement | None:
+        """
+        Находит и кликает соединение одним execute_script. Возвращает None,
+        если скрипт не выполнился (например, list_root устарел) — тогда
+        вызывающий код идёт по резервному Python-обходу.
+        """
+        try:
+            li = self._d.execute_script(
+                _JS_CLICK_CONNECTION, list_root, connection_title, expand
+            )
+        except Exception:
+            return None
+        if li is None:
+            raise NoSuchElementException(
+                f"Connection '{connection_title}' not found"
+            )
+        return li
+
+    def _find_connection_item(
+        self, list_root: WebElement, connection_title: str
+    ) -> WebElement:
+        """Резервный линейный обход: по round trip на заголовок каждого <li>."""
+        for li in list_root.find_elements(*self.CONNECTION_ITEM):
             title_el = li.find_element(*self.CONNECTION_TITLE)
             if title_el.text.strip() == connection_title:
-                li.click()
-                time.sleep(1.5)
                 return li
         raise NoSuchElementException(f"Connection '{connection_title}' not found")
 
+    def _wait_connection_selected(self, li: WebElement, timeout: int = 5) -> None:
+        """
+        Ждет наблюдаемого следствия выбора соединения: класс selected/active
+        на элементе либо разблокированную кнопку 'Добавить запрос'. Раньше
+        здесь был фиксированный time.sleep(1.5).
+        """
+
+        def _ready(_):
+            cls = li.get_attribute("class") or ""
+            if "selected" in cls or "active" in cls:
+                return True
+            try:
+                btn = self._d.find_element(*self.ADD_QUERY_OPEN_BUTTON)
+            except NoSuchElementException:
+                return False
+            return btn.is_enabled()
+
+        try:
+            self._wait_for(timeout).until(_ready)
+        except TimeoutException:
+            pass
+
     # ---------------- Правая колонка: карточки запросов ----------------
 
     # Правая колонка: список запросов (через data-testid)
-    QUERIES_CONTAINER = (
-        By.CSS_SELECTOR,
-        "[data-testid='sql-manager-queries-container']",
-    )
-    QUERY_CARD = (
-        By.CSS_SELECTOR,
-        "div.query-card",  # у каждой карточки есть data-query-name и data-query-key
-    )
-    PREVIEW_LOADER = (
-        By.CSS_SELECTOR,
-        "[data-testid^='sql-manager-query-preview-container-'] .local-loading-overlay",
-    )
-    EXPORT_DEST_SELECT = (
-        By.CSS_SELECTOR,
-        "[data-testid='sql-manager-export-destination']",
-    )
-    EXPORT_CONFIRM_BTN = (
-        By.CSS_SELECTOR,
-        "[data-testid='sql-manager-export-confirm']",
-    )
-    EXPORT_CANCEL_BTN = (
-        By.CSS_SELECTOR,
-        "[data-testid='sql-manager-export-cancel']",
-    )
-    SUCCESS_TITLE = (
-        By.CSS_SELECTOR,
-        "[data-testid='messagebox-title']",
-    )
-    SUCCESS_TEXT = (
-        By.CSS_SELECTOR,
-        "[data-testid='messagebox-body']",
-    )
-    SUCCESS_OK_BTN = (
-        By.CSS_SELECTOR,
-        "[data-testid='messagebox-button-OK-0']",
-    )
-    QUERY_EDITOR_CONTAINER = (
-        By.CSS_SELECTOR,
-        "[data-testid^='sql-manager-query-editor-']",
-    )
+    QUERIES_CONTAINER = _QUERIES_CONTAINER
+    QUERY_CARD = _QUERY_CARD
+    PREVIEW_LOADER = _PREVIEW_LOADER
+    EXPORT_DEST_SELECT = _EXPORT_DEST_SELECT
+    EXPORT_CONFIRM_BTN = _EXPORT_CONFIRM_BTN
+    EXPORT_CANCEL_BTN = _EXPORT_CANCEL_BTN
+    SUCCESS_TITLE = _SUCCESS_TITLE
+    SUCCESS_TEXT = _SUCCESS_TEXT
+    SUCCESS_OK_BTN = _SUCCESS_OK_BTN
+    QUERY_EDITOR_CONTAINER = _QUERY_EDITOR_CONTAINER
 
     def find_query_card(
         self, query_name: str | None = None, connection_name: str | None = None
     ):
         """Ищет карточку запроса по data-query-name/connection-name. Возвращает WebElement или None."""
         self._log("find_query_card name=%s conn=%s", query_name, connection_name)
-        css = self.QUERY_CARD[1]
-        if query_name:
-            css += f"[data-query-name='{query_name}']"
-        if connection_name:
-            css += f"[data-connection-name='{connection_name}']"
+        key = (query_name, connection_name)
+        cached = self._card_cache.get(key)
+        if cached is not None:
+            try:
+                cached.is_displayed()
+                return cached
+            except (StaleElementReferenceException, NoSuchElementException):
+                del self._card_cache[key]
+        css = _card_css(query_name, connection_name)
         try:
             card = self.driver.find_element_in_frames(By.CSS_SELECTOR, css)
-            return card
         except Exception:
             raise NoSuchElementException(
                 f"Query card '{query_name}'/'{connection_name}' не найдена"
             )
+        self._card_cache[key] = card
+        return card
 
+    @retry()
     def expand_query_card(
         self, query_name: str | None = None, connection_name: str | None = None
     ) -> WebElement:
         """Ищет карточку, раскрывает если collapsed, возвращает элемент."""
         self._log("expand_query_card name=%s conn=%s", query_name, connection_name)
         card = self.find_query_card(query_name, connection_name)
-        header = self._find_child_by_testid(card, "sql-manager-query-card-header")
-        if not header:
-            header = card
-        cls = card.get_attribute("class") or ""
-        if "collapsed" in cls:
-            header.click()
+        try:
+            self._d.execute_script(_JS_TOGGLE_CARD, card, True)
+        except Exception:
+            # Резерв: пошаговое чтение класса и клик по заголовку.
+            header = self._find_child_by_testid(card, "sql-manager-query-card-header")
+            if not header:
+                header = card
+            cls = card.get_attribute("class") or ""
+            if "collapsed" in cls:
+                header.click()
         self.card = card
         return card
 
@@ -264,10 +466,13 @@ class SqlManagerPage(BasePage):
         self, query_name: str | None = None, connection_name: str | None = None
     ) -> WebElement:
         card = self.find_query_card(query_name, connection_name)
-        header = card.find_element(*self.QUERY_CARD_HEADER)
-        cls = header.get_attribute("class") or ""
-        if "expanded" in cls:
-            header.click()
+        try:
+            self._d.execute_script(_JS_TOGGLE_CARD, card, False)
+        except Exception:
+            header = self._find_child_by_testid(card, "sql-manager-query-card-header")
+            cls = header.get_attribute("class") or ""
+            if "expanded" in cls:
+                header.click()
         self.card = None
         # return card
 
@@ -277,9 +482,11 @@ class SqlManagerPage(BasePage):
         """
         self._log("select_query_connection %s", connection_name)
         select_el = self._find_child_by_testid(self.card, "sql-manager-query-connection-select")
-        Select(select_el).select_by_visible_text(connection_name)
+        if not self._select_by_text_js(select_el, connection_name):
+            Select(select_el).select_by_visible_text(connection_name)
         return select_el
 
+    @retry()
     def click_query_preview(self, timeout: int = 10):
         """
         Жмет кнопку предпросмотра в карточке.
@@ -288,14 +495,14 @@ class SqlManagerPage(BasePage):
         btn = self._find_child_by_testid(self.card, "sql-manager-query-preview")
         self._js_click(btn)
         try:
-            WebDriverWait(self.driver.driver, timeout).until_not(
+            self._wait_for(timeout).until_not(
                 lambda d: self.card.find_element(*self.PREVIEW_LOADER)
             )
         except TimeoutException:
             pass
-        time.sleep(0.5)
         return btn
 
+    @retry()
     def click_query_delete(self):
         """
         Жмет кнопку удаления запроса в карточке.
@@ -303,6 +510,8 @@ class SqlManagerPage(BasePage):
         self._log("click_query_delete")
         btn = self._find_child_by_testid(self.card, "sql-manager-query-delete")
         self._js_click(btn)
+        # Удаление перестраивает список карточек — кэш больше не валиден.
+        self._card_cache.clear()
         return btn
 
     def set_query_text(self, text: str):
@@ -312,7 +521,7 @@ class SqlManagerPage(BasePage):
         self._log("set_query_text")
         editor = self._find_child_by_testid(self.card, "sql-manager-query-editor")
         # Пытаемся использовать CodeMirror API, если он есть
-        self.driver.driver.execute_script(
+        self._d.execute_script(
             """
             const container = arguments[0];
             const cmHost = container.querySelector('.CodeMirror');
@@ -331,9 +540,44 @@ class SqlManagerPage(BasePage):
             editor,
             text,
         )
-        time.sleep(0.5)
+        # Ждём фактического применения текста вместо фиксированной паузы:
+        # на быстрой машине условие истинно уже на первом опросе.
+        try:
+            self._wait_for(3).until(
+                lambda d: self._d.execute_script(
+                    _JS_QUERY_TEXT_APPLIED, editor, text
+                )
+            )
+        except TimeoutException:
+            pass
         return editor
 
+    def set_text_and_preview(self, text: str, timeout: int = 10):
+        """
+        Устанавливает текст запроса и сразу жмёт предпросмотр одним
+        execute_script по текущей карточке, затем одно ожидание исчезновения
+        лоадера. Экономит round trip и паузу между set_query_text и
+        click_query_preview.
+        """
+        self._log("set_text_and_preview timeout=%s", timeout)
+        card = self.card
+        if card is None:
+            raise NoSuchElementException(
+                "Карточка запроса не выбрана (self.card is None)"
+            )
+        error = self._d.execute_script(_JS_SET_TEXT_AND_PREVIEW, card, text)
+        if error:
+            self._log("set_text_and_preview fallback: %s", error, level="warning")
+            self.set_query_text(text)
+            return self.click_query_preview(timeout=timeout)
+        try:
+            self._wait_for(timeout).until_not(
+                lambda d: card.find_element(*self.PREVIEW_LOADER)
+            )
+        except TimeoutException:
+            pass
+        return card
+
     # -------- Экспорт предпросмотра ----------
     def click_export(self):
         """Жмет кнопку 'выгрузить в документ' и ждёт исчезновения лоадера."""
@@ -353,7 +597,8 @@ class SqlManagerPage(BasePage):
         """Выбирает пункт в селекте назначения выгрузки (например 'В текущий документ' или 'В новый файл')."""
         self._log("select_export_destination %s", visible_text)
         sel = self._find_locator(self.EXPORT_DEST_SELECT)
-        Select(sel).select_by_visible_text(visible_text)
+        if not self._select_by_text_js(sel, visible_text):
+            Select(sel).select_by_visible_text(visible_text)
         return sel
 
     def confirm_export(self, timeout: int = 10):
@@ -362,20 +607,21 @@ class SqlManagerPage(BasePage):
         возвращает (title, text) из success-диалога.
         """
         self._log("confirm_export timeout=%s", timeout)
+        # _find_locator оставляет драйвер во фрейме кнопки; лоадер живёт там
+        # же, поэтому дальше опрашиваем его без повторного обхода фреймов.
         btn = self._find_locator(self.EXPORT_CONFIRM_BTN)
-        ActionChains(self.driver.driver).move_to_element(btn).click().perform()
-        # ждём появления лоадера
+        # Hover здесь не нужен: синтетический move в ActionChains только
+        # добавлял hit-testing; JS-клик обходит и возможные перекрытия.
+        self._js_click(btn)
+        loader = self.PREVIEW_LOADER
+        # ждём появления лоадера: find_elements возвращает [], а не бросает
         try:
-            WebDriverWait(self.driver.driver, timeout).until(
-                lambda d: self.driver.find_element_in_frames(*self.PREVIEW_LOADER)
-            )
+            self._wait_for(timeout).until(lambda d: d.find_elements(*loader))
         except TimeoutException:
             pass
         # ждём исчезновения лоадера
         try:
-            WebDriverWait(self.driver.driver, timeout).until_not(
-                lambda d: self.driver.find_element_in_frames(*self.PREVIEW_LOADER)
-            )
+            self._wait_for(timeout).until(lambda d: not d.find_elements(*loader))
         except TimeoutException:
             pass
         return btn
@@ -383,6 +629,8 @@ class SqlManagerPage(BasePage):
     def cancel_export(self):
         """Жмет кнопку отмены в диалоге выгрузки."""
         self._log("cancel_export")
+        if self._js_click_css(self.EXPORT_CANCEL_BTN[1]):
+            return None
         return self._js_click_locator(self.EXPORT_CANCEL_BTN)
 
     def read_success_message(self):
@@ -12,20 +12,20 @@ class SqlModePage(BasePage):
     """
 
     SQL_MANAGER_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-home-open-sql-manager']",
+        By.CSS_SELECTOR,
+        "button[data-testid='sql-home-open-sql-manager']",
     )
     REPORT_MANAGER_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-home-open-report-manager']",
+        By.CSS_SELECTOR,
+        "button[data-testid='sql-home-open-report-manager']",
     )
     QUERY_HISTORY_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-home-open-query-history']",
+        By.CSS_SELECTOR,
+        "button[data-testid='sql-home-open-query-history']",
     )
     LOG_BUTTON = (
-        By.XPATH,
-        "//button[@data-testid='sql-home-open-log']",
+        By.CSS_SELECTOR,
+        "button[data-testid='sql-home-open-log']",
     )
 
     def __init__(self, driver):
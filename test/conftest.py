@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.driver import DriverOnlyOffice
+from src.pages.home_page import HomePage
+from src.pages.editor_page import EditorPage
+from src.pages.plugin_page import PluginPage
+from src.pages.sql_mode_page import SqlModePage
+from src.pages.sql_manager_page import SqlManagerPage
+from test.my_test import worker_debugger_address
+
+
+@pytest.fixture(scope="session")
+def debugger_address() -> str:
+    """
+    Адрес remote-debugger для текущего pytest-процесса. Под pytest-xdist
+    каждый воркер gwN получает порт base+N, чтобы параллельные модули
+    работали с разными экземплярами браузера (pytest -n auto).
+    """
+    return worker_debugger_address()
+
+
+@pytest.fixture(scope="session")
+def oo_ctx(debugger_address):
+    """
+    Поднимает OnlyOffice, открывает документ и SQL Manager один раз на сессию
+    (на воркер под xdist - у каждого процесса своя сессия). Раньше каждый
+    модуль держал собственную копию этой фикстуры и платил за бутстрап дважды.
+    """
+    driver = DriverOnlyOffice(debugger_address=debugger_address)
+    home = HomePage(driver)
+    editor = EditorPage(driver)
+    plugin = PluginPage(driver)
+    sql_mode = SqlModePage(driver)
+    sql_manager = SqlManagerPage(driver)
+
+    home.open_creation_cell()
+    editor.click_plugin_button()
+    editor.try_click_close()
+    plugin.click_main_sql_mode()
+    sql_mode.click_sql_manager()
+
+    ctx = {
+        "driver": driver,
+        "home": home,
+        "editor": editor,
+        "plugin": plugin,
+        "sql_mode": sql_mode,
+        "sql_manager": sql_manager,
+    }
+    yield ctx
+
+    try:
+        driver.driver.quit()
+    except Exception:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _cleanup_created_query(request):
+    """
+    Между тестами удаляет запрос, оставшийся активным в SqlManagerPage, чтобы
+    состояние общей сессии не протекало из одного модуля в другой.
+    """
+    yield
+    if "oo_ctx" not in request.fixturenames:
+        return
+    sqlm: SqlManagerPage = request.getfixturevalue("oo_ctx")["sql_manager"]
+    if sqlm.card is None:
+        return
+    try:
+        sqlm.click_query_delete()
+    except Exception:
+        pass
+    sqlm.card = None
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -13,11 +14,27 @@ from src.pages.sql_mode_page import SqlModePage
 from src.pages.sql_manager_page import SqlManagerPage
 from src.utils.timer import Timer, format_summary
 from src.utils.logging_utils import setup_logging
-import time
+from selenium.webdriver.support.ui import Select, WebDriverWait
 
-def main():
+
+def worker_debugger_address(base_port: int | None = None) -> str:
+    """
+    Адрес remote-debugger текущего процесса: под pytest-xdist воркер gwN
+    получает порт base+N, чтобы параллельные прогоны не делили один браузер
+    (та же логика, что у фикстуры debugger_address в conftest).
+    """
+    if base_port is None:
+        base_port = int(os.environ.get("OO_DEBUGGER_PORT", "9222"))
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    offset = int(worker[2:]) if worker.startswith("gw") else 0
+    return f"127.0.0.1:{base_port + offset}"
+
+
+def main(debugger_address: str | None = None):
     logger = setup_logging()
-    driver = DriverOnlyOffice()
+    driver = DriverOnlyOffice(
+        debugger_address=debugger_address or worker_debugger_address()
+    )
     home_page = HomePage(driver)
     editor_page = EditorPage(driver)
     plugin_page = PluginPage(driver)
@@ -73,8 +90,10 @@ def main():
     timer.mark("preview_query")
 
     sql_manager_page.click_export()
-    sql_manager_page.select_export_destination("В новый файл")
-    time.sleep(2)
+    sel = sql_manager_page.select_export_destination("В новый файл")
+    WebDriverWait(driver.driver, 5).until(
+        lambda d: Select(sel).first_selected_option.text.strip() == "В новый файл"
+    )
     sql_manager_page.select_export_destination("В текущий документ")
     sql_manager_page.confirm_export(30)
     # читает данные для вывода куда то 